@@ -109,6 +109,9 @@ class NominalOrchestrator:
                     f"Exception: {str(e)}",
                 )
 
+        # Release the reader's OCR threads and Tesseract models until the next batch
+        self.reader.close()
+
         logger.info(
             f"Processing complete: {stats['matched']} matched, "
             f"{stats['unmatched']} unmatched, {stats['errors']} errors"
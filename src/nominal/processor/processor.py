@@ -9,6 +9,7 @@ Processing Flow:
 4. Log unmatched documents as errors
 """
 
+from collections.abc import Iterable
 from typing import Any
 
 from nominal.logging import setup_logger
@@ -17,6 +18,66 @@ from nominal.rules import Rule, RuleParser, RulesManager
 logger = setup_logger()
 
 
+class _LiteralScan:
+    """
+    Per-document record of which rule literals the text contains.
+
+    Rules reject a document outright when it is shorter than they allow (see
+    Rule.min_text_length) or one of their required literals (see
+    Rule.required_literals) is missing. Many rules share literals, so each
+    distinct literal is searched for at most once per document, the lowered
+    copy of the text is built at most once, and rules missing a literal are
+    skipped without being applied.
+    """
+
+    __slots__ = ("text", "_folded_text", "_found", "_folded_found")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._folded_text: str | None = None
+        self._found: dict[str, bool] = {}
+        self._folded_found: dict[str, bool] = {}
+
+    @property
+    def folded_text(self) -> str:
+        """The lowered document text, computed on first use."""
+        if self._folded_text is None:
+            self._folded_text = self.text.lower()
+        return self._folded_text
+
+    def admits(self, rule: Rule) -> bool:
+        """Whether the document is long enough and contains every literal the rule requires."""
+        if len(self.text) < rule.min_text_length:
+            return False
+        literals, folded_literals = rule.required_literals
+
+        found = self._found
+        for literal in literals:
+            present = found.get(literal)
+            if present is None:
+                present = found[literal] = literal in self.text
+            if not present:
+                return False
+
+        found = self._folded_found
+        for literal in folded_literals:
+            present = found.get(literal)
+            if present is None:
+                present = found[literal] = literal in self.folded_text
+            if not present:
+                return False
+
+        return True
+
+    def apply(self, rule: Rule) -> dict[str, Any] | None:
+        """Apply the rule to the document, skipping it if a required literal is missing."""
+        if not self.admits(rule):
+            return None
+        folded_text = self.folded_text if rule.folds_case else self._folded_text
+        # The rule's own length and literal checks were just made here
+        return rule.apply(self.text, folded_text=folded_text, prescanned=True)
+
+
 class NominalProcessor:
     """Main processor class that orchestrates rule matching and variable extraction."""
 
@@ -98,20 +159,35 @@ class NominalProcessor:
             logger.error(f"Failed to load rule from {rule_path}: {e}")
             raise
 
-    def _apply_global_rules(self, text: str) -> dict[str, Any]:
+    def load_rules_from(self, other: "NominalProcessor"):
+        """
+        Use the rules another processor has loaded, without parsing them again.
+
+        Rules are immutable, so they are shared rather than copied; batch state
+        (global variables, unmatched documents) stays with each processor.
+
+        Args:
+            other: Processor whose global and form rules to use
+        """
+        self.global_rules = list(other.global_rules)
+        self.form_rules = list(other.form_rules)
+
+    def _apply_global_rules(self, text: str, scan: _LiteralScan | None = None) -> dict[str, Any]:
         """
         Apply all global rules to extract variables from a document.
 
         Args:
             text: The document text
+            scan: Literal scan of the document shared with classification
 
         Returns:
             Dict of extracted variables from all global rules
         """
+        scan = scan or _LiteralScan(text)
         extracted_vars: dict[str, Any] = {}
 
         for rule in self.global_rules:
-            result = rule.apply(text)
+            result = scan.apply(rule)
             if result:
                 # Merge all extracted variables
                 all_vars = result.get("variables", {})
@@ -122,18 +198,22 @@ class NominalProcessor:
 
         return extracted_vars
 
-    def _classify_document(self, text: str) -> tuple[Rule | None, dict[str, Any] | None]:
+    def _classify_document(
+        self, text: str, scan: _LiteralScan | None = None
+    ) -> tuple[Rule | None, dict[str, Any] | None]:
         """
         Classify a document by finding the first matching form rule.
 
         Args:
             text: The document text
+            scan: Literal scan of the document shared with global extraction
 
         Returns:
             Tuple of (matching rule, result dict) or (None, None) if no match
         """
+        scan = scan or _LiteralScan(text)
         for rule in self.form_rules:
-            result = rule.apply(text)
+            result = scan.apply(rule)
             if result:
                 logger.debug(f"Document matched form rule: {rule.rule_id}")
                 return rule, result
@@ -142,7 +222,7 @@ class NominalProcessor:
 
     def process_document(
         self,
-        text: str,
+        text: str | Iterable[str],
         document_id: str | None = None,
         enforce_global: bool = False,
     ) -> dict[str, Any] | None:
@@ -150,7 +230,8 @@ class NominalProcessor:
         Process a single document: extract global variables, then classify.
 
         Args:
-            text: The document text to process
+            text: The document text to process, or its pages (e.g. from
+                  NominalReader.iter_pdf_pages), which are joined with newlines
             document_id: Optional identifier for the document (for error logging)
             enforce_global: If True, check that global variables match existing values
 
@@ -158,15 +239,22 @@ class NominalProcessor:
             Dict with 'rule_id', 'global_variables', 'local_variables'
             if classified. None if unmatched.
         """
+        if not isinstance(text, str):
+            # Extraction patterns may span page breaks, so rules see the whole document
+            text = "\n".join(text)
+
         doc_id = document_id or f"doc_{len(self.unmatched_documents) + 1}"
         logger.info(f"Processing document: {doc_id} ({len(text)} characters)")
 
+        # Literal lookups are shared by the global and form rules
+        scan = _LiteralScan(text)
+
         # Step 1: Apply global rules to extract variables
-        extracted_global_vars = self._apply_global_rules(text)
+        extracted_global_vars = self._apply_global_rules(text, scan)
         logger.debug(f"Extracted {len(extracted_global_vars)} global variable(s) from document")
 
         # Step 2: Classify document using form rules
-        matched_rule, classification_result = self._classify_document(text)
+        matched_rule, classification_result = self._classify_document(text, scan)
 
         if matched_rule is None:
             # Document didn't match any form rule
@@ -1,119 +1,383 @@
-import io
+import hashlib
+import itertools
 import os
-
-import fitz  # PyMuPDF
-import pytesseract
-from PIL import Image
+import queue
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 
 from nominal.logging import setup_logger
 
 logger = setup_logger()
 
+# PyMuPDF, Tesseract and Pillow are heavy C extensions; they are imported on first
+# use so that importing this module (or constructing a reader) stays cheap.
+_fitz = None
+
+# Tesseract is CPU-bound, so a few pages are OCR'd at once; more than this mostly
+# contends for cores Tesseract itself uses
+_OCR_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Most OCR results kept in an OCR cache directory; the least recently used are
+# removed when a reader using the directory is created
+_OCR_CACHE_MAX_ENTRIES = 10_000
+
+# The tesserocr module: False until first used, None if it is not installed
+_tesserocr = False
+
+
+def _get_fitz():
+    """Import PyMuPDF on first use and return the module."""
+    global _fitz
+    if _fitz is None:
+        import fitz  # PyMuPDF
+
+        _fitz = fitz
+    return _fitz
+
+
+def _new_tesserocr_api():
+    """
+    Create a tesserocr API, or return None if tesserocr is not installed.
+
+    tesserocr runs Tesseract in-process, so its model is loaded once per API
+    instead of once per page as with pytesseract, which runs the tesseract
+    binary. Readers keep their APIs for reuse across pages and PDFs (see
+    NominalReader.close).
+    """
+    global _tesserocr
+    if _tesserocr is False:
+        try:
+            import tesserocr
+        except ImportError:
+            tesserocr = None
+        _tesserocr = tesserocr
+    return _tesserocr.PyTessBaseAPI() if _tesserocr is not None else None
+
+
+@dataclass(slots=True, frozen=True)
+class _PageImage:
+    """A rendered page: 8-bit grayscale pixels, one byte per pixel, rows unpadded."""
+
+    samples: bytes
+    width: int
+    height: int
+
+    def to_pgm(self) -> bytes:
+        """Encode as binary PGM, an uncompressed format Tesseract reads directly."""
+        return b"P5\n%d %d\n255\n" % (self.width, self.height) + self.samples
+
+
+def _prune_ocr_cache(cache_dir: Path, max_entries: int = _OCR_CACHE_MAX_ENTRIES):
+    """Remove the least recently used OCR results beyond max_entries."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".txt"):
+                entries.append((entry.stat().st_mtime, entry.path))
+    if len(entries) <= max_entries:
+        return
+
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    logger.debug("Pruned %d OCR cache entries", len(entries) - max_entries)
+
 
 class NominalReader:
-    def __init__(self, ocr_fallback: bool = True, min_text_length: int = 50):
+    def __init__(
+        self,
+        ocr_fallback: bool = True,
+        min_text_length: int = 50,
+        ocr_cache_dir: str | Path | None = None,
+    ):
+        """
+        Args:
+            ocr_fallback: Whether to OCR pages with little or no extractable text
+            min_text_length: Pages with less extracted text than this are OCR candidates
+            ocr_cache_dir: Optional directory (e.g. ~/.cache/nominal/ocr) in which to
+                keep OCR results keyed by a hash of the rendered page, so pages seen
+                before (re-processed files, shared form templates) skip Tesseract
+        """
         self.ocr_fallback = ocr_fallback
         self.min_text_length = min_text_length
+        # OCR threads and idle tesserocr APIs, created on first use and kept across
+        # PDFs so Tesseract's model is loaded once per thread, not once per document
+        self._ocr_executor: ThreadPoolExecutor | None = None
+        self._tesserocr_apis: queue.SimpleQueue = queue.SimpleQueue()
+        self.ocr_cache_dir = Path(ocr_cache_dir) if ocr_cache_dir is not None else None
+        if self.ocr_cache_dir is not None:
+            # The cache is best-effort: without a usable directory, pages are just OCR'd
+            try:
+                self.ocr_cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning("Could not create OCR cache %s: %s", self.ocr_cache_dir, e)
+                self.ocr_cache_dir = None
+            else:
+                try:
+                    _prune_ocr_cache(self.ocr_cache_dir)
+                except OSError as e:
+                    logger.warning("Could not prune OCR cache %s: %s", self.ocr_cache_dir, e)
+
+    def __enter__(self):
+        return self
 
-    def read_pdf(self, file_path: str) -> str:
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the OCR threads and Tesseract models held by this reader.
+
+        The reader stays usable; they are created again if another PDF needs OCR.
+        """
+        if self._ocr_executor is not None:
+            self._ocr_executor.shutdown()
+            self._ocr_executor = None
+        while True:
+            try:
+                api = self._tesserocr_apis.get_nowait()
+            except queue.Empty:
+                break
+            api.End()
+
+    def read_pdf(self, file_path: str, max_pages: int | None = None) -> str:
         """
         Reads a PDF file and extracts text.
         If text extraction yields little result and ocr_fallback is True,
         it attempts to OCR the pages.
+
+        Args:
+            file_path: Path to the PDF file
+            max_pages: Only read this many leading pages (default: all pages)
+        """
+        pages = list(self.iter_pdf_pages(file_path, max_pages=max_pages))
+        text = "\n".join(pages)
+        logger.info(
+            f"Successfully read PDF: {len(text)} total characters from {len(pages)} page(s)"
+        )
+        return text
+
+    def iter_pdf_pages(self, file_path: str, max_pages: int | None = None) -> Iterator[str]:
+        """
+        Reads a PDF file and yields the text of each page as it is extracted.
+
+        With max_pages, only that many leading pages are read; later pages are never
+        loaded, so e.g. classifying a form by its first page doesn't pay for the rest.
+
+        Pages are OCR'd under the same conditions as read_pdf, so joining the
+        yielded pages with newlines gives the same text as read_pdf.
+
+        Pages are rendered for OCR on this thread (PyMuPDF is not thread-safe),
+        but Tesseract runs in the reader's bounded thread pool, so a scanned
+        document's pages are recognised concurrently. Pages are still yielded in
+        order, each as soon as it and every page before it are done.
         """
         logger.info(f"Reading PDF: {file_path}")
 
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
+        fitz = _get_fitz()
 
-        text_content = []
+        # Pages not yet yielded, in order: (page number, extracted text, pending OCR)
+        pending: deque[tuple[int, str, Future[str] | None]] = deque()
+        doc = None
 
         try:
             doc = fitz.open(file_path)
             total_pages = len(doc)
             logger.debug(f"Opened PDF with {total_pages} page(s)")
 
-            for page_num, page in enumerate(doc, 1):
-                text = page.get_text()
-                logger.debug(f"Page {page_num}/{total_pages}: Extracted {len(text)} characters")
-
-                should_ocr = False
-
-                # Condition 1: Text is very sparse
-                if len(text.strip()) < self.min_text_length:
-                    # Check if there are any images to OCR
-                    if page.get_images():
-                        should_ocr = True
-                        logger.debug(
-                            f"Page {page_num}: Text too sparse ({len(text.strip())} chars), "
-                            f"attempting OCR"
-                        )
-
-                # Condition 2: Page contains a large image (likely a scan),
-                # even if there is some text (e.g. headers)
-                if not should_ocr and self.ocr_fallback:
-                    page_area = page.rect.width * page.rect.height
-                    images_info = page.get_image_info()
-                    for img in images_info:
-                        bbox = fitz.Rect(img["bbox"])
-                        img_area = bbox.width * bbox.height
-                        # If an image covers more than 30% of the page, it's a candidate for OCR
-                        if img_area > (page_area * 0.3):
-                            should_ocr = True
-                            logger.debug(
-                                f"Page {page_num}: Large image detected "
-                                f"({img_area / page_area * 100:.1f}% of page), attempting OCR"
-                            )
-                            break
-
-                if self.ocr_fallback and should_ocr:
-                    logger.info(f"Page {page_num}: Performing OCR")
-                    ocr_text = self._ocr_page(page)
-                    # If OCR provides significantly more text, use it
-                    # We use a factor of 1.2 to ensure the OCR adds value over the existing text
-                    if len(ocr_text.strip()) > len(text.strip()) * 1.2:
-                        text = ocr_text
-                        logger.info(
-                            f"Page {page_num}: OCR provided {len(ocr_text)} chars "
-                            f"(vs {len(page.get_text())} from text extraction)"
-                        )
+            for page_num, page in enumerate(itertools.islice(doc, max_pages), 1):
+                # Plain text explicitly: the structured modes ("blocks", "dict", ...) are
+                # several times slower and the rules only ever match against plain text
+                text = page.get_text("text")
+                logger.debug(
+                    "Page %d/%d: Extracted %d characters", page_num, total_pages, len(text)
+                )
+
+                ocr = None
+                if self.ocr_fallback and self._should_ocr(page, page_num, text):
+                    logger.info("Page %d: Performing OCR", page_num)
+                    image, cache_file = self._render_page(page)
+                    cached = self._read_ocr_cache(cache_file)
+                    if cached is not None:
+                        ocr = Future()
+                        ocr.set_result(cached)
                     else:
-                        logger.debug(
-                            f"Page {page_num}: OCR did not provide enough improvement, "
-                            f"using text extraction"
-                        )
+                        if self._ocr_executor is None:
+                            self._ocr_executor = ThreadPoolExecutor(max_workers=_OCR_WORKERS)
+                        ocr = self._ocr_executor.submit(self._ocr_to_cache, image, cache_file)
+                pending.append((page_num, text, ocr))
 
-                text_content.append(text)
+                while pending and (pending[0][2] is None or pending[0][2].done()):
+                    yield self._page_text(*pending.popleft())
 
-            doc.close()
-            total_text = len("\n".join(text_content))
-            logger.info(
-                f"Successfully read PDF: {total_text} total characters from {total_pages} page(s)"
-            )
+            while pending:
+                yield self._page_text(*pending.popleft())
+        except fitz.FileNotFoundError:
+            # PyMuPDF checks the path itself before opening, so it isn't stat'ed here too
+            logger.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         except Exception as e:
             logger.error(f"Failed to read PDF {file_path}: {e}")
             raise RuntimeError(f"Failed to read PDF: {e}")
+        finally:
+            # Also reached when the consumer stops early and the generator is closed
+            for _, _, ocr in pending:
+                if ocr is not None:
+                    ocr.cancel()
+            if doc is not None:
+                doc.close()
+
+    def _should_ocr(self, page, page_num: int, text: str) -> bool:
+        """Whether a page's extracted text is worth replacing with OCR."""
+        # Condition 1: Text is very sparse
+        if len(text.strip()) < self.min_text_length:
+            # Check if there are any images to OCR
+            if page.get_images():
+                logger.debug(
+                    "Page %d: Text too sparse (%d chars), attempting OCR",
+                    page_num,
+                    len(text.strip()),
+                )
+                return True
+
+        # Condition 2: Page contains a large image (likely a scan),
+        # even if there is some text (e.g. headers)
+        fitz = _get_fitz()
+        page_area = page.rect.width * page.rect.height
+        images_info = page.get_image_info()
+        for img in images_info:
+            bbox = fitz.Rect(img["bbox"])
+            img_area = bbox.width * bbox.height
+            # If an image covers more than 30% of the page, it's a candidate for OCR
+            if img_area > (page_area * 0.3):
+                logger.debug(
+                    "Page %d: Large image detected (%.1f%% of page), attempting OCR",
+                    page_num,
+                    img_area / page_area * 100,
+                )
+                return True
+
+        return False
+
+    def _page_text(self, page_num: int, text: str, ocr: Future[str] | None) -> str:
+        """Pick between a page's extracted text and its OCR text, waiting for the OCR."""
+        if ocr is None:
+            return text
 
-        return "\n".join(text_content)
+        ocr_text = ocr.result()
+        # If OCR provides significantly more text, use it
+        # We use a factor of 1.2 to ensure the OCR adds value over the existing text
+        if len(ocr_text.strip()) > len(text.strip()) * 1.2:
+            logger.info(
+                "Page %d: OCR provided %d chars (vs %d from text extraction)",
+                page_num,
+                len(ocr_text),
+                len(text),
+            )
+            return ocr_text
+
+        logger.debug(
+            "Page %d: OCR did not provide enough improvement, using text extraction",
+            page_num,
+        )
+        return text
 
-    def _ocr_page(self, page) -> str:
+    def _render_page(self, page) -> tuple[_PageImage, Path | None]:
         """
-        Renders a PDF page to an image and performs OCR.
+        Renders a PDF page to a grayscale image for OCR.
+
+        Returns:
+            Tuple of (image, OCR cache file for the image, or None without a cache)
         """
+        fitz = _get_fitz()
+
         logger.debug("Rendering page to image for OCR")
 
         # Render page to an image (pixmap)
-        # matrix=fitz.Matrix(2, 2) increases resolution for better OCR (approx 144 DPI -> 288 DPI)
-        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
+        # matrix=fitz.Matrix(2, 2) doubles the resolution for better OCR (72 DPI -> 144 DPI).
+        # Tesseract binarises its input, so render straight to grayscale: a third of the
+        # bytes of RGB to render, copy and hash, and no colour conversion in Tesseract.
+        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), colorspace=fitz.csGRAY, alpha=False)
 
-        # Convert to PIL Image
-        img_data = pix.tobytes("png")
-        image = Image.open(io.BytesIO(img_data))
+        # Keep the raw pixels rather than encoding to PNG and decoding again;
+        # the pixmap has no alpha channel and its rows are unpadded
+        samples = pix.samples
+        image = _PageImage(samples, pix.width, pix.height)
 
+        cache_file = None
+        if self.ocr_cache_dir is not None:
+            digest = hashlib.blake2b(f"{pix.width}x{pix.height}:".encode(), digest_size=16)
+            digest.update(samples)
+            cache_file = self.ocr_cache_dir / f"{digest.hexdigest()}.txt"
+        return image, cache_file
+
+    def _read_ocr_cache(self, cache_file: Path | None) -> str | None:
+        """Return a cached OCR result, marking it recently used, or None on a miss."""
+        if cache_file is None:
+            return None
+        try:
+            text = cache_file.read_text(encoding="utf-8", newline="")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read OCR cache entry %s: %s", cache_file, e)
+            return None
+        try:
+            os.utime(cache_file)
+        except OSError as e:
+            # e.g. pruned by another reader since it was read; the text is still good
+            logger.warning("Could not mark OCR cache entry %s as used: %s", cache_file, e)
+        logger.debug("Using cached OCR result %s", cache_file.name)
+        return text
+
+    def _ocr_to_cache(self, image, cache_file: Path | None) -> str:
+        """OCR an image, storing the result in the OCR cache if there is one."""
+        text = self._ocr_image(image)
+        if cache_file is not None:
+            # Write then rename, so concurrent readers never see a partial file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_file.write_text(text, encoding="utf-8", newline="")
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.warning("Could not write OCR cache entry %s: %s", cache_file, e)
+                try:
+                    tmp_file.unlink(missing_ok=True)
+                except OSError:
+                    pass
+        return text
+
+    def _ocr_image(self, image: _PageImage) -> str:
+        """Run Tesseract on a rendered page, in-process via tesserocr if it is installed."""
         # Perform OCR
         logger.debug("Running Tesseract OCR")
-        text = pytesseract.image_to_string(image)
+        try:
+            api = self._tesserocr_apis.get_nowait()
+        except queue.Empty:
+            api = _new_tesserocr_api()
+        if api is not None:
+            try:
+                api.SetImageBytes(image.samples, image.width, image.height, 1, image.width)
+                text = api.GetUTF8Text()
+            finally:
+                self._tesserocr_apis.put(api)
+        else:
+            import pytesseract
+
+            # Given an image object, pytesseract saves it to a temporary PNG for the
+            # tesseract binary; an uncompressed PGM file skips zlib on both sides
+            with tempfile.NamedTemporaryFile(suffix=".pgm", delete_on_close=False) as f:
+                f.write(image.to_pgm())
+                f.close()
+                text = pytesseract.image_to_string(f.name)
         logger.debug(f"OCR extracted {len(text)} characters")
 
         return text
@@ -4,21 +4,27 @@ Action classes for extracting and transforming variables.
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
 from nominal.logging import setup_logger
 
+from .criterion import _compile_pattern
 from .enums import ActionType
 from .name_validator import validate_full_name
 
 logger = setup_logger()
 
 
+@dataclass(slots=True, frozen=True)
 class Action(ABC):
     """Abstract base class for actions."""
 
-    def __init__(self, variable: str):
-        self.variable = variable
+    # Set by each concrete action; compared by identity in Rule
+    action_type: ClassVar[ActionType]
+
+    variable: str
 
     @abstractmethod
     def act(self, text: str, variables: dict[str, str]) -> str | None:
@@ -34,35 +40,39 @@ class Action(ABC):
         """
         pass
 
-    @abstractmethod
     def get_type(self) -> ActionType:
         """Get the action type."""
-        pass
+        return self.action_type
 
 
+@dataclass(slots=True, frozen=True)
 class SetAction(Action):
     """Action that sets a variable to a literal value."""
 
-    def __init__(self, variable: str, value: str):
-        super().__init__(variable)
-        self.value = value
+    action_type: ClassVar[ActionType] = ActionType.SET
+
+    value: str
 
     def act(self, text: str, variables: dict[str, str]) -> str | None:
         logger.info(f"Setting variable: {self.variable}='{self.value}'")
         return self.value
 
-    def get_type(self) -> ActionType:
-        return ActionType.SET
-
 
+@dataclass(slots=True, frozen=True)
 class RegexExtractAction(Action):
     """Action that extracts a value from text using a regex pattern."""
 
-    def __init__(self, variable: str, pattern: str, group: int = 0, from_text: bool = True):
-        super().__init__(variable)
-        self.pattern = pattern
-        self.group = group
-        self.from_text = from_text
+    action_type: ClassVar[ActionType] = ActionType.REGEX_EXTRACT
+
+    pattern: str
+    group: int = 0
+    from_text: bool = True
+
+    # Compiled once at construction; None if the pattern is invalid
+    _compiled: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_compiled", _compile_pattern(self.pattern))
 
     def act(self, text: str, variables: dict[str, str]) -> str | None:
         if self.from_text:
@@ -70,11 +80,10 @@ class RegexExtractAction(Action):
                 f"Attempting regex extraction for {self.variable}: pattern='{self.pattern}'"
             )
 
-            try:
-                match = re.search(self.pattern, text)
-            except re.error as e:
-                logger.error(f"Invalid regex pattern '{self.pattern}' for {self.variable}: {e}")
+            if self._compiled is None:
+                logger.error(f"Invalid regex pattern '{self.pattern}' for {self.variable}")
                 return None
+            match = self._compiled.search(text)
 
             if match:
                 # group(0) is the full match, group(1+) are capture groups
@@ -90,18 +99,41 @@ class RegexExtractAction(Action):
                 logger.debug(f"✗ Regex pattern did not match for {self.variable}")
         return None
 
-    def get_type(self) -> ActionType:
-        return ActionType.REGEX_EXTRACT
 
+# Derivation methods: name -> (function of the source value and its baked arguments,
+# function baking the action's args once at construction, verb for logging)
+_DERIVE_METHODS: dict[str, tuple[Callable[..., str], Callable[..., Any], str]] = {
+    "slice": (
+        lambda value, bounds: value[bounds],
+        lambda args: slice(args.get("start"), args.get("end")),
+        "slicing",
+    ),
+    "upper": (lambda value, _: value.upper(), lambda args: None, "uppercasing"),
+    "lower": (lambda value, _: value.lower(), lambda args: None, "lowercasing"),
+}
 
+
+@dataclass(slots=True, frozen=True)
 class DeriveAction(Action):
     """Action that derives a value from another variable."""
 
-    def __init__(self, variable: str, from_var: str, method: str, args: dict[str, Any]):
-        super().__init__(variable)
-        self.from_var = from_var
-        self.method = method
-        self.args = args
+    action_type: ClassVar[ActionType] = ActionType.DERIVE
+
+    from_var: str
+    method: str
+    args: dict[str, Any]
+
+    # The derivation function, its arguments (e.g. a slice for "slice") and its log
+    # verb, resolved once at construction; _fn is None if the method is unknown
+    _fn: Callable[[str, Any], str] | None = field(init=False, repr=False, compare=False)
+    _fn_args: Any = field(init=False, repr=False, compare=False)
+    _verb: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        fn, bake, verb = _DERIVE_METHODS.get(self.method, (None, lambda args: None, None))
+        object.__setattr__(self, "_fn", fn)
+        object.__setattr__(self, "_fn_args", bake(self.args))
+        object.__setattr__(self, "_verb", verb)
 
     def act(self, text: str, variables: dict[str, str]) -> str | None:
         # Skip derivation if the variable already exists (was extracted directly)
@@ -125,44 +157,43 @@ class DeriveAction(Action):
             f"using method '{self.method}'"
         )
 
-        try:
-            if self.method == "slice":
-                start = self.args.get("start")
-                end = self.args.get("end")
-                result = source_value[start:end]
-                logger.info(f"✓ Derived {self.variable}='{result}' by slicing {self.from_var}")
-                return result
-
-            elif self.method == "upper":
-                result = source_value.upper()
-                logger.info(f"✓ Derived {self.variable}='{result}' by uppercasing {self.from_var}")
-                return result
-
-            elif self.method == "lower":
-                result = source_value.lower()
-                logger.info(f"✓ Derived {self.variable}='{result}' by lowercasing {self.from_var}")
-                return result
-
-            else:
-                logger.error(f"Unknown derivation method '{self.method}' for {self.variable}")
+        if self._fn is None:
+            logger.error(f"Unknown derivation method '{self.method}' for {self.variable}")
+            return None
 
+        try:
+            result = self._fn(source_value, self._fn_args)
+            logger.info(f"✓ Derived {self.variable}='{result}' by {self._verb} {self.from_var}")
+            return result
         except Exception as e:
             logger.error(f"Error deriving {self.variable} from {self.from_var}: {e}")
 
         return None
 
-    def get_type(self) -> ActionType:
-        return ActionType.DERIVE
-
 
+@dataclass(slots=True, frozen=True)
 class ExtractAction(Action):
     """Action that extracts a value from another variable using various methods."""
 
-    def __init__(self, variable: str, from_var: str, method: str, args: dict[str, Any]):
-        super().__init__(variable)
-        self.from_var = from_var
-        self.method = method
-        self.args = args
+    action_type: ClassVar[ActionType] = ActionType.EXTRACT
+
+    from_var: str
+    method: str
+    args: dict[str, Any]
+
+    # The split pattern, compiled once at construction; None if invalid or unused
+    _split_pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    # The index of the part to keep, read from args once at construction; 0 if unused
+    _split_index: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        split_pattern = None
+        split_index = 0
+        if self.method == "split":
+            split_pattern = _compile_pattern(self.args.get("pattern", r"\s+"))
+            split_index = self.args.get("index", 0)
+        object.__setattr__(self, "_split_pattern", split_pattern)
+        object.__setattr__(self, "_split_index", split_index)
 
     def act(self, text: str, variables: dict[str, str]) -> str | None:
         if self.from_var not in variables:
@@ -179,9 +210,11 @@ class ExtractAction(Action):
 
         try:
             if self.method == "split":
-                pattern = self.args.get("pattern", r"\s+")
-                index = self.args.get("index", 0)
-                parts = re.split(pattern, source_value)
+                if self._split_pattern is None:
+                    logger.error(f"Invalid split pattern for {self.variable}")
+                    return None
+                index = self._split_index
+                parts = self._split_pattern.split(source_value)
                 if 0 <= index < len(parts):
                     result = parts[index]
                     logger.info(
@@ -201,26 +234,23 @@ class ExtractAction(Action):
 
         return None
 
-    def get_type(self) -> ActionType:
-        return ActionType.EXTRACT
-
 
+@dataclass(slots=True, frozen=True)
 class ValidatedRegexExtractAction(Action):
     """Action that extracts a value using regex and validates it as a person name."""
 
-    def __init__(
-        self,
-        variable: str,
-        pattern: str,
-        group: int = 0,
-        from_text: bool = True,
-        min_confidence: float = 0.5,
-    ):
-        super().__init__(variable)
-        self.pattern = pattern
-        self.group = group
-        self.from_text = from_text
-        self.min_confidence = min_confidence
+    action_type: ClassVar[ActionType] = ActionType.VALIDATED_REGEX_EXTRACT
+
+    pattern: str
+    group: int = 0
+    from_text: bool = True
+    min_confidence: float = 0.5
+
+    # Compiled once at construction; None if the pattern is invalid
+    _compiled: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_compiled", _compile_pattern(self.pattern, re.IGNORECASE))
 
     def act(self, text: str, variables: dict[str, str]) -> str | None:
         if not self.from_text:
@@ -231,12 +261,11 @@ class ValidatedRegexExtractAction(Action):
             f"pattern='{self.pattern}'"
         )
 
-        try:
-            # Find all matches instead of just the first
-            matches = list(re.finditer(self.pattern, text, re.IGNORECASE))
-        except re.error as e:
-            logger.error(f"Invalid regex pattern '{self.pattern}' for {self.variable}: {e}")
+        if self._compiled is None:
+            logger.error(f"Invalid regex pattern '{self.pattern}' for {self.variable}")
             return None
+        # Find all matches instead of just the first
+        matches = list(self._compiled.finditer(text))
 
         if not matches:
             logger.debug(f"✗ Regex pattern did not match for {self.variable}")
@@ -287,6 +316,3 @@ class ValidatedRegexExtractAction(Action):
             )
 
         return None
-
-    def get_type(self) -> ActionType:
-        return ActionType.VALIDATED_REGEX_EXTRACT
@@ -2,8 +2,12 @@
 Criterion classes for matching document content.
 """
 
+import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import ClassVar
 
 from nominal.logging import setup_logger
 
@@ -12,17 +16,33 @@ from .enums import CriterionType
 logger = setup_logger()
 
 
+@dataclass(slots=True, frozen=True)
 class Criterion(ABC):
     """Abstract base class for matching criteria."""
 
-    def __init__(self, description: str = ""):
-        self.description = description
+    # Relative evaluation cost; cheaper criteria are evaluated first where order is free
+    cost: ClassVar[int] = 0
+
+    def captures(self) -> bool:
+        """Whether matching this criterion can capture variables."""
+        return False
+
+    def folds_case(self) -> bool:
+        """Whether matching this criterion searches the lowered text."""
+        return False
+
+    def min_text_length(self) -> int:
+        """A lower bound on the length of any text this criterion matches."""
+        return 0
 
     @abstractmethod
-    def match(self, text: str) -> tuple[bool, dict[str, str]]:
+    def match(self, text: str, folded_text: str | None = None) -> tuple[bool, dict[str, str]]:
         """
         Check if the criterion matches the given text.
 
+        Callers that already have ``folded_text`` (``text.lower()``) may pass it so
+        case-insensitive criteria do not lower the text again.
+
         Returns:
             Tuple of (match_result, captured_variables)
         """
@@ -34,32 +54,48 @@ class Criterion(ABC):
         pass
 
 
+@dataclass(slots=True, frozen=True)
 class ContainsCriterion(Criterion):
     """Criterion that checks if text contains a specific value."""
 
-    def __init__(self, value: str, case_sensitive: bool = True, description: str = ""):
-        super().__init__(description)
-        self.value = value
-        self.case_sensitive = case_sensitive
+    cost: ClassVar[int] = 1
 
-    def match(self, text: str) -> tuple[bool, dict[str, str]]:
-        logger.debug(
-            f"Checking contains criterion: '{self.value}' (case_sensitive={self.case_sensitive})"
+    value: str
+    case_sensitive: bool = True
+    description: str = ""
+
+    # The value as searched for: lowered once here for case-insensitive matching
+    _needle: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_needle", self.value if self.case_sensitive else self.value.lower()
         )
 
-        search_text = text
-        search_value = self.value
+    def folds_case(self) -> bool:
+        return not self.case_sensitive
 
-        if not self.case_sensitive:
-            search_text = text.lower()
-            search_value = self.value.lower()
+    def min_text_length(self) -> int:
+        # Lowering can lengthen text (e.g. "İ"), so only exact matches bound it
+        return len(self.value) if self.case_sensitive else 0
+
+    def match(self, text: str, folded_text: str | None = None) -> tuple[bool, dict[str, str]]:
+        logger.debug(
+            "Checking contains criterion: '%s' (case_sensitive=%s)", self.value, self.case_sensitive
+        )
 
-        result = search_value in search_text
+        if self.case_sensitive:
+            search_text = text
+        elif folded_text is not None:
+            search_text = folded_text
+        else:
+            search_text = text.lower()
+        result = self._needle in search_text
 
         if result:
-            logger.debug(f"✓ Contains criterion matched: '{self.value}'")
+            logger.debug("✓ Contains criterion matched: '%s'", self.value)
         else:
-            logger.debug(f"✗ Contains criterion failed: '{self.value}' not found")
+            logger.debug("✗ Contains criterion failed: '%s' not found", self.value)
 
         return (result, {})
 
@@ -67,39 +103,50 @@ class ContainsCriterion(Criterion):
         return CriterionType.CONTAINS
 
 
+@dataclass(slots=True, frozen=True)
 class RegexCriterion(Criterion):
     """Criterion that matches text using a regular expression."""
 
-    def __init__(
-        self,
-        pattern: str,
-        capture: bool = False,
-        variable: str | None = None,
-        description: str = "",
-    ):
-        super().__init__(description)
-        self.pattern = pattern
-        self.capture = capture
-        self.variable = variable
-
-    def match(self, text: str) -> tuple[bool, dict[str, str]]:
-        logger.debug(f"Checking regex criterion: pattern='{self.pattern}', capture={self.capture}")
-
-        try:
-            match = re.search(self.pattern, text)
-        except re.error as e:
-            logger.error(f"Invalid regex pattern '{self.pattern}': {e}")
+    cost: ClassVar[int] = 2
+
+    pattern: str
+    capture: bool = False
+    variable: str | None = None
+    description: str = ""
+
+    # Compiled once at construction; None if the pattern is invalid
+    _compiled: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_compiled", _compile_pattern(self.pattern))
+
+    def captures(self) -> bool:
+        return self.capture and bool(self.variable)
+
+    def min_text_length(self) -> int:
+        return _min_match_length(self.pattern) if self._compiled is not None else 0
+
+    def match(self, text: str, folded_text: str | None = None) -> tuple[bool, dict[str, str]]:
+        logger.debug(
+            "Checking regex criterion: pattern='%s', capture=%s", self.pattern, self.capture
+        )
+
+        if self._compiled is None:
+            logger.error("Invalid regex pattern '%s'", self.pattern)
             return (False, {})
+        match = self._compiled.search(text)
 
         captured = {}
         if match:
             if self.capture and self.variable:
                 captured[self.variable] = match.group(0)
-                logger.info(f"✓ Regex matched and captured: {self.variable}='{match.group(0)}'")
+                logger.info(
+                    "✓ Regex matched and captured: %s='%s'", self.variable, captured[self.variable]
+                )
             else:
-                logger.debug(f"✓ Regex criterion matched: '{self.pattern}'")
+                logger.debug("✓ Regex criterion matched: '%s'", self.pattern)
         else:
-            logger.debug(f"✗ Regex criterion failed: pattern '{self.pattern}' not found")
+            logger.debug("✗ Regex criterion failed: pattern '%s' not found", self.pattern)
 
         return (match is not None, captured)
 
@@ -107,56 +154,208 @@ class RegexCriterion(Criterion):
         return CriterionType.REGEX
 
 
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str] | None:
+    """
+    Compile a rule's regex pattern, returning None (and logging why) if it is invalid.
+
+    An invalid pattern does not fail rule parsing; the criterion or action using
+    it simply never matches.
+    """
+    try:
+        return re.compile(pattern, flags)
+    except re.error as e:
+        logger.error("Invalid regex pattern '%s': %s", pattern, e)
+        return None
+
+
+# Characters that end a pattern's leading run of literal characters
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+_REGEX_QUANTIFIERS = frozenset("*+?{")
+
+
+def _min_match_length(pattern: str) -> int:
+    """
+    Return a lower bound on the length of any string the pattern matches.
+
+    Only the pattern's leading run of literal characters is counted, less its
+    last character when a quantifier follows ("ab?" matches "a"). A pattern with
+    an alternation anywhere gets no bound, since "abc|d" matches "d".
+    """
+    if "|" in pattern:
+        return 0
+
+    length = 0
+    while length < len(pattern) and pattern[length] not in _REGEX_SPECIAL:
+        length += 1
+    if length and pattern[length : length + 1] in _REGEX_QUANTIFIERS:
+        length -= 1
+    return length
+
+
+def _sort_by_cost(criteria: list[Criterion]) -> list[Criterion]:
+    """
+    Return criteria ordered cheapest-first, keeping declaration order for ties.
+
+    Criteria that capture variables make evaluation order observable (which
+    capture wins), so lists containing any of them are returned unchanged.
+    """
+    if any(criterion.captures() for criterion in criteria):
+        return list(criteria)
+    return sorted(criteria, key=lambda criterion: criterion.cost)
+
+
+@dataclass(slots=True, frozen=True)
 class AllCriterion(Criterion):
-    """Composite criterion that requires all sub-criteria to match."""
+    """
+    Composite criterion that requires all sub-criteria to match.
+
+    Sub-criteria are evaluated cheapest-first and evaluation stops at the first
+    one that fails. With ``thorough=True`` every sub-criterion is evaluated and
+    logged, which is useful when diagnosing why a rule did or did not match.
+    """
+
+    cost: ClassVar[int] = 3
+
+    sub_criteria: list[Criterion]
+    description: str = ""
+    thorough: bool = field(default=False, kw_only=True)
+
+    # Whether any sub-criterion searches the lowered text, so it is lowered once here
+    _folds_case: bool = field(init=False, repr=False, compare=False)
+    # Bound match methods of the sub-criteria in evaluation (cheapest-first) order, so
+    # match() skips the per-call lookup; sub_criteria itself keeps the declared order
+    _match_fns: tuple[Callable[[str, str | None], tuple[bool, dict[str, str]]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_folds_case", any(criterion.folds_case() for criterion in self.sub_criteria)
+        )
+        object.__setattr__(
+            self,
+            "_match_fns",
+            tuple(criterion.match for criterion in _sort_by_cost(self.sub_criteria)),
+        )
+
+    def captures(self) -> bool:
+        return any(criterion.captures() for criterion in self.sub_criteria)
+
+    def folds_case(self) -> bool:
+        return self._folds_case
 
-    def __init__(self, sub_criteria: list[Criterion], description: str = ""):
-        super().__init__(description)
-        self.sub_criteria = sub_criteria
+    def min_text_length(self) -> int:
+        return max((criterion.min_text_length() for criterion in self.sub_criteria), default=0)
 
-    def match(self, text: str) -> tuple[bool, dict[str, str]]:
-        logger.debug(f"Evaluating ALL criterion with {len(self.sub_criteria)} sub-criteria")
+    def match(self, text: str, folded_text: str | None = None) -> tuple[bool, dict[str, str]]:
+        match_fns = self._match_fns
+        if folded_text is None and self._folds_case:
+            folded_text = text.lower()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Evaluating ALL criterion with %d sub-criteria", len(match_fns))
 
         all_captured = {}
+        failed = 0
 
-        for i, criterion in enumerate(self.sub_criteria, 1):
-            matches, captured = criterion.match(text)
+        for match in match_fns:
+            matches, captured = match(text, folded_text)
             if not matches:
-                logger.debug(
-                    f"✗ ALL criterion failed: sub-criterion {i}/{len(self.sub_criteria)} "
-                    f"did not match"
-                )
-                return (False, {})
+                if debug:
+                    logger.debug(
+                        "✗ ALL criterion failed: sub-criterion %d/%d did not match",
+                        match_fns.index(match) + 1,
+                        len(match_fns),
+                    )
+                if not self.thorough:
+                    return (False, {})
+                failed += 1
+                continue
             all_captured.update(captured)
 
-        logger.debug(f"✓ ALL criterion matched: all {len(self.sub_criteria)} sub-criteria passed")
+        if failed:
+            return (False, {})
+
+        if debug:
+            logger.debug("✓ ALL criterion matched: all %d sub-criteria passed", len(match_fns))
         return (True, all_captured)
 
     def get_type(self) -> CriterionType:
         return CriterionType.ALL
 
 
+@dataclass(slots=True, frozen=True)
 class AnyCriterion(Criterion):
-    """Composite criterion that requires at least one sub-criterion to match."""
+    """
+    Composite criterion that requires at least one sub-criterion to match.
+
+    Sub-criteria are evaluated cheapest-first and evaluation stops at the first
+    one that matches. With ``thorough=True`` every sub-criterion is evaluated and
+    logged; the captures of the first match are still the ones returned.
+    """
+
+    cost: ClassVar[int] = 3
+
+    sub_criteria: list[Criterion]
+    description: str = ""
+    thorough: bool = field(default=False, kw_only=True)
+
+    # Whether any sub-criterion searches the lowered text, so it is lowered once here
+    _folds_case: bool = field(init=False, repr=False, compare=False)
+    # Bound match methods of the sub-criteria in evaluation (cheapest-first) order, so
+    # match() skips the per-call lookup; sub_criteria itself keeps the declared order
+    _match_fns: tuple[Callable[[str, str | None], tuple[bool, dict[str, str]]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_folds_case", any(criterion.folds_case() for criterion in self.sub_criteria)
+        )
+        object.__setattr__(
+            self,
+            "_match_fns",
+            tuple(criterion.match for criterion in _sort_by_cost(self.sub_criteria)),
+        )
 
-    def __init__(self, sub_criteria: list[Criterion], description: str = ""):
-        super().__init__(description)
-        self.sub_criteria = sub_criteria
+    def captures(self) -> bool:
+        return any(criterion.captures() for criterion in self.sub_criteria)
 
-    def match(self, text: str) -> tuple[bool, dict[str, str]]:
-        logger.debug(f"Evaluating ANY criterion with {len(self.sub_criteria)} sub-criteria")
+    def folds_case(self) -> bool:
+        return self._folds_case
 
-        for i, criterion in enumerate(self.sub_criteria, 1):
-            matches, captured = criterion.match(text)
-            if matches:
-                logger.debug(
-                    f"✓ ANY criterion matched: sub-criterion {i}/{len(self.sub_criteria)} passed"
-                )
-                return (True, captured)
+    def min_text_length(self) -> int:
+        return min((criterion.min_text_length() for criterion in self.sub_criteria), default=0)
 
-        logger.debug(
-            f"✗ ANY criterion failed: none of {len(self.sub_criteria)} sub-criteria matched"
-        )
+    def match(self, text: str, folded_text: str | None = None) -> tuple[bool, dict[str, str]]:
+        match_fns = self._match_fns
+        if folded_text is None and self._folds_case:
+            folded_text = text.lower()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Evaluating ANY criterion with %d sub-criteria", len(match_fns))
+
+        first_match = None
+
+        for match in match_fns:
+            matches, captured = match(text, folded_text)
+            if matches:
+                if debug:
+                    logger.debug(
+                        "✓ ANY criterion matched: sub-criterion %d/%d passed",
+                        match_fns.index(match) + 1,
+                        len(match_fns),
+                    )
+                if not self.thorough:
+                    return (True, captured)
+                if first_match is None:
+                    first_match = captured
+
+        if first_match is not None:
+            return (True, first_match)
+
+        if debug:
+            logger.debug("✗ ANY criterion failed: none of %d sub-criteria matched", len(match_fns))
         return (False, {})
 
     def get_type(self) -> CriterionType:
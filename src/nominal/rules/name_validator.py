@@ -13,11 +13,15 @@ def _load_names_from_file(filename: str) -> set[str]:
     data_dir = Path(__file__).parent.parent.parent.parent / "data"
     filepath = data_dir / filename
 
-    if not filepath.exists():
+    try:
+        # Read the whole dictionary and uppercase/split it in C rather than line by line
+        text = filepath.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return set()
 
-    with open(filepath, encoding="utf-8") as f:
-        return {line.strip().upper() for line in f if line.strip()}
+    names = {line.strip() for line in text.upper().splitlines()}
+    names.discard("")
+    return names
 
 
 def get_first_names() -> set[str]:
@@ -6,7 +6,17 @@ Supports two types of rules:
 - Form rules: Use 'form_name' field, classify documents
 """
 
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+from collections.abc import Callable, Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
@@ -33,27 +43,263 @@ from .rule import Rule
 
 logger = setup_logger()
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared read-only default for optional sections, so parsing allocates none
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _intern(name: Any) -> Any:
+    """
+    Intern a variable name.
+
+    The same names (SSN, FORM_NAME, ...) are used as dict keys across many rules
+    and actions; interned keys let those dict operations compare by identity.
+    Non-string values (e.g. a missing name) are returned unchanged.
+    """
+    return sys.intern(name) if isinstance(name, str) else name
+
+
+def _json_cache_file(content: bytes) -> Path | None:
+    """
+    Path of the on-disk JSON copy of a rule file, or None if the cache is disabled.
+
+    The cache is enabled by setting NOMINAL_RULES_CACHE_DIR. Entries are keyed on
+    a hash of the file's contents, so an edited rule file gets a new entry; old
+    entries are never read again and may be deleted at any time.
+    """
+    cache_dir = os.getenv("NOMINAL_RULES_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / f"{hashlib.sha1(content).hexdigest()}.json"
+
+
+def _write_json_cache(cache_file: Path, data: Any) -> None:
+    """
+    Store rule data as JSON, if it survives a JSON round trip unchanged.
+
+    Data using YAML-only types (dates, non-string keys, ...) is not cached.
+    The file is written atomically so concurrent readers never see a partial entry.
+    """
+    try:
+        encoded = json.dumps(data)
+    except (TypeError, ValueError):
+        return
+    if json.loads(encoded) != data:
+        return
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(encoded)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        logger.warning("Could not write rule cache %s: %s", cache_file, e)
+
+
+@lru_cache(maxsize=512)
+def _parse_content_cached(content: bytes) -> Rule:
+    """
+    Parse the contents of a rule file.
+
+    Cached on the raw bytes, so identical rule files (duplicated fixtures, copies
+    of a rules tree) are only parsed once and share the same immutable Rule.
+    Raises yaml.YAMLError for invalid YAML; errors are not cached.
+
+    With NOMINAL_RULES_CACHE_DIR set, the YAML is also cached across processes
+    as JSON (see _json_cache_file), which loads far faster than YAML.
+    """
+    cache_file = _json_cache_file(content)
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rb") as f:
+                return RuleParser().parse_dict(json.load(f))
+        except (OSError, ValueError):
+            # Missing or unreadable entry; fall back to the YAML
+            pass
+
+    data = yaml.load(content, Loader=_YAML_LOADER)
+    rule = RuleParser().parse_dict(data)
+    if cache_file is not None:
+        _write_json_cache(cache_file, data)
+    return rule
+
+
+@lru_cache(maxsize=512)
+def _parse_file_cached(rule_path: str, mtime_ns: int, size: int) -> Rule:
+    """
+    Load and parse a rule file.
+
+    Cached on the file's path, modification time and size, so repeated loads of
+    an unchanged file return the same (immutable) Rule while edits invalidate
+    the entry automatically.
+    """
+    with open(rule_path, "rb") as f:
+        content = f.read()
+
+    try:
+        return _parse_content_cached(content)
+    except yaml.YAMLError as e:
+        logger.error("Invalid YAML in rule file %s: %s", rule_path, e)
+        raise ValueError(f"Invalid YAML in rule file {rule_path}: {e}")
+
+
+def _build_contains(data: dict[str, Any], sub_criteria: list[Criterion]) -> Criterion:
+    return ContainsCriterion(
+        value=data.get("value"),
+        case_sensitive=data.get("case_sensitive", True),
+        description=data.get("description", ""),
+    )
+
+
+# Any of these makes a pattern more than a plain literal
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def _build_regex(data: dict[str, Any], sub_criteria: list[Criterion]) -> Criterion:
+    pattern = data.get("pattern")
+    if (
+        isinstance(pattern, str)
+        and pattern
+        and not data.get("capture", False)
+        and not _REGEX_METACHARS.search(pattern)
+    ):
+        # A literal pattern is just a substring test; str.__contains__ beats the regex engine
+        return ContainsCriterion(value=pattern, description=data.get("description", ""))
+
+    return RegexCriterion(
+        pattern=data.get("pattern"),
+        capture=data.get("capture", False),
+        variable=_intern(data.get("variable")),
+        description=data.get("description", ""),
+    )
+
+
+def _build_all(data: dict[str, Any], sub_criteria: list[Criterion]) -> Criterion:
+    return AllCriterion(
+        sub_criteria=sub_criteria,
+        thorough=data.get("thorough", False),
+        description=data.get("description", ""),
+    )
+
+
+def _build_any(data: dict[str, Any], sub_criteria: list[Criterion]) -> Criterion:
+    return AnyCriterion(
+        sub_criteria=sub_criteria,
+        thorough=data.get("thorough", False),
+        description=data.get("description", ""),
+    )
+
+
+# Criterion builders by type, called with the criterion's data and its parsed sub-criteria
+_CRITERION_BUILDERS: dict[str, Callable[[dict[str, Any], list[Criterion]], Criterion]] = {
+    CriterionType.CONTAINS: _build_contains,
+    CriterionType.REGEX: _build_regex,
+    CriterionType.ALL: _build_all,
+    CriterionType.ANY: _build_any,
+}
+
+# Criterion types whose 'criteria' entries are parsed as sub-criteria
+_COMPOSITE_TYPES = frozenset({CriterionType.ALL, CriterionType.ANY})
+
+# Marks an exhausted iterator in RuleParser._parse_criterion
+_DONE = object()
+
+
+def _criterion_frame(data: dict[str, Any], siblings: list[Criterion]) -> tuple:
+    """
+    Build the stack frame used by RuleParser._parse_criterion for one criterion.
+
+    Returns:
+        Tuple of (data, builder, parsed sub-criteria, iterator over sub-criteria data,
+        list the built criterion is appended to)
+    """
+    criterion_type = data.get("type")
+    if not criterion_type:
+        raise ValueError("Criterion must have a 'type' field")
+
+    builder = _CRITERION_BUILDERS.get(criterion_type)
+    if builder is None:
+        raise ValueError(f"Unknown criterion type: {criterion_type}")
+
+    sub_criteria_data = data.get("criteria", ()) if criterion_type in _COMPOSITE_TYPES else ()
+    return data, builder, [], iter(sub_criteria_data), siblings
+
+
+def _build_set(data: dict[str, Any], variable: str) -> Action:
+    return SetAction(variable=variable, value=data.get("value"))
+
+
+def _build_regex_extract(data: dict[str, Any], variable: str) -> Action:
+    return RegexExtractAction(
+        variable=variable,
+        pattern=data.get("pattern"),
+        group=data.get("group", 0),
+        from_text=data.get("from_text", False),
+    )
+
+
+def _build_derive(data: dict[str, Any], variable: str) -> Action:
+    return DeriveAction(
+        variable=variable,
+        from_var=_intern(data.get("from")),
+        method=data.get("method"),
+        args=data.get("args") or {},
+    )
+
+
+def _build_extract(data: dict[str, Any], variable: str) -> Action:
+    return ExtractAction(
+        variable=variable,
+        from_var=_intern(data.get("from")),
+        method=data.get("method"),
+        args=data.get("args") or {},
+    )
+
+
+def _build_validated_regex_extract(data: dict[str, Any], variable: str) -> Action:
+    return ValidatedRegexExtractAction(
+        variable=variable,
+        pattern=data.get("pattern"),
+        group=data.get("group", 0),
+        from_text=data.get("from_text", False),
+        min_confidence=data.get("min_confidence", 0.5),
+    )
+
+
+# Action builders by type, called with the action's data and its (interned) variable name
+_ACTION_BUILDERS: dict[str, Callable[[dict[str, Any], str], Action]] = {
+    ActionType.SET: _build_set,
+    ActionType.REGEX_EXTRACT: _build_regex_extract,
+    ActionType.DERIVE: _build_derive,
+    ActionType.EXTRACT: _build_extract,
+    ActionType.VALIDATED_REGEX_EXTRACT: _build_validated_regex_extract,
+}
+
 
 class RuleParser:
     """Parses YAML rule files into Rule objects."""
 
     def parse_file(self, rule_path: str) -> Rule:
         """Parse a YAML rule file."""
-        logger.info(f"Parsing rule file: {rule_path}")
+        logger.info("Parsing rule file: %s", rule_path)
 
         path = Path(rule_path)
-        if not path.exists():
-            logger.error(f"Rule file not found: {rule_path}")
-            raise FileNotFoundError(f"Rule file not found: {rule_path}")
-
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            logger.error(f"Invalid YAML in rule file {rule_path}: {e}")
-            raise ValueError(f"Invalid YAML in rule file {rule_path}: {e}")
+            stat = os.stat(path)
+        except FileNotFoundError:
+            logger.error("Rule file not found: %s", rule_path)
+            raise FileNotFoundError(f"Rule file not found: {rule_path}") from None
 
-        return self.parse_dict(data)
+        return _parse_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached results of parse_file."""
+        _parse_file_cached.cache_clear()
+        _parse_content_cached.cache_clear()
 
     def parse_dict(self, data: dict[str, Any]) -> Rule:
         """Parse a dictionary into a Rule object."""
@@ -67,37 +313,43 @@ class RuleParser:
         required_fields = ["criteria", "actions"]
         for field in required_fields:
             if field not in data:
-                logger.error(f"Missing required field in rule {rule_id}: {field}")
+                logger.error("Missing required field in rule %s: %s", rule_id, field)
                 raise ValueError(f"Missing required field: {field}")
 
-        logger.debug(f"Parsing rule: {rule_id}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Parsing rule: %s", rule_id)
 
         # Parse variables (optional for global rules)
-        variables = data.get("variables", {})
-        global_vars = variables.get("global", [])
-        local_vars = variables.get("local", [])
+        variables = data.get("variables") or _EMPTY_MAPPING
+        global_vars = [_intern(name) for name in variables.get("global", ())]
+        local_vars = [_intern(name) for name in variables.get("local", ())]
 
-        logger.debug(
-            f"Rule {rule_id} variables: global={len(global_vars)}, " f"local={len(local_vars)}"
-        )
+        if debug:
+            logger.debug(
+                "Rule %s variables: global=%d, local=%d", rule_id, len(global_vars), len(local_vars)
+            )
 
         # Parse criteria
         try:
             criteria = [self._parse_criterion(c) for c in data["criteria"]]
-            logger.debug(f"Parsed {len(criteria)} criteria for rule {rule_id}")
+            if debug:
+                logger.debug("Parsed %d criteria for rule %s", len(criteria), rule_id)
         except Exception as e:
-            logger.error(f"Error parsing criteria for rule {rule_id}: {e}")
+            logger.error("Error parsing criteria for rule %s: %s", rule_id, e)
             raise
 
         # Parse actions
         try:
             actions = [self._parse_action(a) for a in data["actions"]]
-            logger.debug(f"Parsed {len(actions)} actions for rule {rule_id}")
+            if debug:
+                logger.debug("Parsed %d actions for rule %s", len(actions), rule_id)
         except Exception as e:
-            logger.error(f"Error parsing actions for rule {rule_id}: {e}")
+            logger.error("Error parsing actions for rule %s: %s", rule_id, e)
             raise
 
-        logger.info(f"✓ Successfully parsed rule: {rule_id}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✓ Successfully parsed rule: %s", rule_id)
 
         return Rule(
             rule_id=rule_id,
@@ -109,40 +361,24 @@ class RuleParser:
         )
 
     def _parse_criterion(self, data: dict[str, Any]) -> Criterion:
-        """Parse a criterion dictionary."""
-        criterion_type = data.get("type")
-        if not criterion_type:
-            raise ValueError("Criterion must have a 'type' field")
-
-        description = data.get("description", "")
-
-        if criterion_type == CriterionType.CONTAINS:
-            return ContainsCriterion(
-                value=data.get("value"),
-                case_sensitive=data.get("case_sensitive", True),
-                description=description,
-            )
-
-        elif criterion_type == CriterionType.REGEX:
-            return RegexCriterion(
-                pattern=data.get("pattern"),
-                capture=data.get("capture", False),
-                variable=data.get("variable"),
-                description=description,
-            )
-
-        elif criterion_type == CriterionType.ALL:
-            sub_criteria_data = data.get("criteria", [])
-            sub_criteria = [self._parse_criterion(c) for c in sub_criteria_data]
-            return AllCriterion(sub_criteria=sub_criteria, description=description)
-
-        elif criterion_type == CriterionType.ANY:
-            sub_criteria_data = data.get("criteria", [])
-            sub_criteria = [self._parse_criterion(c) for c in sub_criteria_data]
-            return AnyCriterion(sub_criteria=sub_criteria, description=description)
-
-        else:
-            raise ValueError(f"Unknown criterion type: {criterion_type}")
+        """
+        Parse a criterion dictionary.
+
+        Nested ALL/ANY criteria are walked iteratively (post-order, with an
+        explicit stack) rather than recursively, so deep nesting costs no Python
+        frames and cannot hit the recursion limit.
+        """
+        parsed: list[Criterion] = []
+        stack = [_criterion_frame(data, parsed)]
+        while stack:
+            data, builder, sub_criteria, pending, siblings = stack[-1]
+            sub_data = next(pending, _DONE)
+            if sub_data is not _DONE:
+                stack.append(_criterion_frame(sub_data, sub_criteria))
+                continue
+            stack.pop()
+            siblings.append(builder(data, sub_criteria))
+        return parsed[0]
 
     def _parse_action(self, data: dict[str, Any]) -> Action:
         """Parse an action dictionary."""
@@ -150,43 +386,8 @@ class RuleParser:
         if not action_type:
             raise ValueError("Action must have a 'type' field")
 
-        variable = data.get("variable", "")
-
-        if action_type == ActionType.SET:
-            return SetAction(variable=variable, value=data.get("value"))
-
-        elif action_type == ActionType.REGEX_EXTRACT:
-            return RegexExtractAction(
-                variable=variable,
-                pattern=data.get("pattern"),
-                group=data.get("group", 0),
-                from_text=data.get("from_text", False),
-            )
-
-        elif action_type == ActionType.DERIVE:
-            return DeriveAction(
-                variable=variable,
-                from_var=data.get("from"),
-                method=data.get("method"),
-                args=data.get("args", {}),
-            )
-
-        elif action_type == ActionType.EXTRACT:
-            return ExtractAction(
-                variable=variable,
-                from_var=data.get("from"),
-                method=data.get("method"),
-                args=data.get("args", {}),
-            )
-
-        elif action_type == ActionType.VALIDATED_REGEX_EXTRACT:
-            return ValidatedRegexExtractAction(
-                variable=variable,
-                pattern=data.get("pattern"),
-                group=data.get("group", 0),
-                from_text=data.get("from_text", False),
-                min_confidence=data.get("min_confidence", 0.5),
-            )
-
-        else:
+        variable = _intern(data.get("variable", ""))
+        builder = _ACTION_BUILDERS.get(action_type)
+        if builder is None:
             raise ValueError(f"Unknown action type: {action_type}")
+        return builder(data, variable)
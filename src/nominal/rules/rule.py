@@ -2,19 +2,42 @@
 Rule class for representing form identification rules.
 """
 
-from dataclasses import dataclass
+import logging
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 from nominal.logging import setup_logger
 
 from .action import Action
-from .criterion import Criterion
+from .criterion import AllCriterion, ContainsCriterion, Criterion, _sort_by_cost
 from .enums import ActionType
 
 logger = setup_logger()
 
 
-@dataclass
+def _flatten_conjunction(criteria: list[Criterion]) -> Iterator[Criterion]:
+    """
+    Yield the criteria of a conjunction, inlining nested non-thorough ALL criteria.
+
+    A top-level ALL only adds a level of dispatch: each of its sub-criteria must
+    hold just like a top-level criterion, so they are yielded in its place (in
+    declaration order, so captures still resolve the same way). Thorough ALL
+    criteria are kept intact since they exist for their diagnostic logging.
+    """
+    for criterion in criteria:
+        if isinstance(criterion, AllCriterion) and not criterion.thorough:
+            yield from _flatten_conjunction(criterion.sub_criteria)
+        else:
+            yield criterion
+
+
+def _by_selectivity(literals: list[str]) -> tuple[str, ...]:
+    """Deduplicate literals and order them longest first (ties keep declaration order)."""
+    return tuple(sorted(dict.fromkeys(literals), key=len, reverse=True))
+
+
+@dataclass(slots=True, frozen=True)
 class Rule:
     """Represents a complete rule for a form type."""
 
@@ -25,17 +48,123 @@ class Rule:
     criteria: list[Criterion]
     actions: list[Action]
 
+    # Derived at construction time (see __post_init__)
+    _min_text_length: int = field(init=False, repr=False, compare=False)
+    _literals: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _folded_literals: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _criteria: tuple[Criterion, ...] = field(init=False, repr=False, compare=False)
+    _criteria_fold_case: bool = field(init=False, repr=False, compare=False)
+    _compiled_criteria: tuple[Callable[[str, str | None], tuple[bool, dict[str, str]]], ...] = (
+        field(init=False, repr=False, compare=False)
+    )
+    _non_derive_actions: tuple[Action, ...] = field(init=False, repr=False, compare=False)
+    _derive_actions: tuple[Action, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Precompute the evaluation plan used by apply().
+
+        Top-level criteria are conjunctive, so every ContainsCriterion value is a
+        literal the document must contain, including those nested in top-level
+        ALL criteria. Those are deduplicated and checked up front in a single
+        sweep (case-insensitive ones against one lowered copy of the text) before
+        any regex or composite criterion is evaluated, and the remaining criteria
+        are ordered cheapest-first (see Criterion.cost).
+
+        Literals are checked longest first: a longer literal is less likely to
+        occur in an unrelated document, so mismatches are usually rejected by the
+        first check.
+
+        Documents shorter than the longest text some criterion requires (see
+        Criterion.min_text_length) are rejected before any search.
+
+        Actions are split once into the extraction and derivation phases.
+        """
+        object.__setattr__(
+            self,
+            "_min_text_length",
+            max((criterion.min_text_length() for criterion in self.criteria), default=0),
+        )
+
+        literals = []
+        folded_literals = []
+        remaining = []
+        for criterion in _flatten_conjunction(self.criteria):
+            if isinstance(criterion, ContainsCriterion):
+                if criterion.case_sensitive:
+                    literals.append(criterion._needle)
+                else:
+                    folded_literals.append(criterion._needle)
+            else:
+                remaining.append(criterion)
+
+        object.__setattr__(self, "_literals", _by_selectivity(literals))
+        object.__setattr__(self, "_folded_literals", _by_selectivity(folded_literals))
+        # Cheapest first; the list is left as declared if any criterion captures
+        remaining = _sort_by_cost(remaining)
+        object.__setattr__(self, "_criteria", tuple(remaining))
+        object.__setattr__(
+            self, "_criteria_fold_case", any(criterion.folds_case() for criterion in remaining)
+        )
+        # Bound match methods, so apply() skips the per-call method lookup
+        object.__setattr__(
+            self, "_compiled_criteria", tuple(criterion.match for criterion in remaining)
+        )
+
+        object.__setattr__(
+            self,
+            "_non_derive_actions",
+            tuple(action for action in self.actions if action.action_type is not ActionType.DERIVE),
+        )
+        object.__setattr__(
+            self,
+            "_derive_actions",
+            tuple(action for action in self.actions if action.action_type is ActionType.DERIVE),
+        )
+
+    def __hash__(self) -> int:
+        # Equal rules share a rule_id, so hashing on it alone is consistent with
+        # the generated __eq__ and lets rules key dicts despite their list fields
+        return hash(self.rule_id)
+
     @property
     def all_variables(self) -> list[str]:
         """Returns all variable names defined in this rule."""
         return self.global_variables + self.local_variables
 
-    def apply(self, text: str) -> dict[str, Any] | None:
+    @property
+    def required_literals(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """
+        Literals a document must contain for this rule to match.
+
+        Returns:
+            Tuple of (case-sensitive literals, lowercased case-insensitive literals)
+        """
+        return self._literals, self._folded_literals
+
+    @property
+    def min_text_length(self) -> int:
+        """Documents shorter than this cannot match the rule."""
+        return self._min_text_length
+
+    @property
+    def folds_case(self) -> bool:
+        """Whether applying this rule searches the lowered text."""
+        return bool(self._folded_literals) or self._criteria_fold_case
+
+    def apply(
+        self, text: str, folded_text: str | None = None, *, prescanned: bool = False
+    ) -> dict[str, Any] | None:
         """
         Apply the rule to the given text.
         Returns all extracted variables if all criteria match, None otherwise.
         Scope separation is handled by the processor.
 
+        Callers applying many rules to one document may pass ``folded_text``
+        (``text.lower()``) so it is not recomputed for every rule. Callers that
+        have already checked the text against ``min_text_length`` and
+        ``required_literals`` pass ``prescanned=True`` to skip those checks.
+
         Action execution order:
         1. First phase: Execute all non-derive actions (set, regex_extract, extract)
            to extract global and local variables from the document text.
@@ -44,42 +173,93 @@ class Rule:
 
         This ensures derived variables are computed AFTER all source variables are available.
         """
-        logger.info(f"Evaluating rule: {self.rule_id}")
-        logger.debug(f"Rule description: {self.description}")
-
-        # Check if all criteria match and collect captured variables
-        all_captured_values = {}
-        logger.debug(f"Checking {len(self.criteria)} criteria")
-        for i, criterion in enumerate(self.criteria, 1):
-            matches, captured = criterion.match(text)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        info = logger.isEnabledFor(logging.INFO)
+
+        if info:
+            logger.info("Evaluating rule: %s", self.rule_id)
+        if debug:
+            logger.debug("Rule description: %s", self.description)
+
+        # Reject early if the document is too short or any required literal is missing
+        if not prescanned:
+            if len(text) < self._min_text_length:
+                if info:
+                    logger.info(
+                        "✗ Rule %s rejected: text shorter than %d characters",
+                        self.rule_id,
+                        self._min_text_length,
+                    )
+                return None
+            for literal in self._literals:
+                if literal not in text:
+                    if info:
+                        logger.info("✗ Rule %s rejected: '%s' not found", self.rule_id, literal)
+                    return None
+            if self._folded_literals:
+                if folded_text is None:
+                    folded_text = text.lower()
+                for literal in self._folded_literals:
+                    if literal not in folded_text:
+                        if info:
+                            logger.info("✗ Rule %s rejected: '%s' not found", self.rule_id, literal)
+                        return None
+        # Lower the text once for any case-insensitive checks left in the criteria
+        if folded_text is None and self._criteria_fold_case:
+            folded_text = text.lower()
+
+        # Check if all remaining criteria match and collect captured variables; the
+        # dict is only built once something is captured, so rejections allocate nothing
+        matchers = self._compiled_criteria
+        all_captured_values = None
+        if debug:
+            logger.debug("Checking %d criteria", len(matchers))
+        for match in matchers:
+            matches, captured = match(text, folded_text)
             if not matches:
-                logger.info(
-                    f"✗ Rule {self.rule_id} rejected: criterion {i}/{len(self.criteria)} failed"
-                )
+                if info:
+                    logger.info(
+                        "✗ Rule %s rejected: criterion %d/%d failed",
+                        self.rule_id,
+                        matchers.index(match) + 1,
+                        len(matchers),
+                    )
                 return None
-            all_captured_values.update(captured)
+            if captured:
+                if all_captured_values is None:
+                    all_captured_values = dict(captured)
+                else:
+                    all_captured_values.update(captured)
 
-        logger.info(f"✓ All criteria passed for rule {self.rule_id}")
+        if info:
+            logger.info("✓ All criteria passed for rule %s", self.rule_id)
+
+        return self._run_actions(text, {} if all_captured_values is None else all_captured_values)
+
+    def _run_actions(self, text: str, captured_values: dict[str, str]) -> dict[str, Any]:
+        """
+        Run the rule's actions once all criteria have matched and build the result.
+
+        ``captured_values`` becomes the result's variables (it is not copied), so
+        callers pass a dict of their own.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Initialize variables with captured values from criteria
-        all_variables = {}
-        all_variables.update(all_captured_values)
+        all_variables = captured_values
 
-        # Separate actions into two phases:
+        # Actions run in two phases (partitioned in __post_init__):
         # Phase 1: Non-derive actions (set, regex_extract, extract) - extract global/local vars
         # Phase 2: Derive actions - compute derived vars from extracted vars
-        non_derive_actions = [
-            action for action in self.actions if action.get_type() != ActionType.DERIVE
-        ]
-        derive_actions = [
-            action for action in self.actions if action.get_type() == ActionType.DERIVE
-        ]
+        non_derive_actions = self._non_derive_actions
+        derive_actions = self._derive_actions
 
         # Phase 1: Execute non-derive actions to extract global and local variables
-        logger.debug(
-            f"Phase 1: Executing {len(non_derive_actions)} extraction actions "
-            f"(set, regex_extract, extract)"
-        )
+        if debug:
+            logger.debug(
+                "Phase 1: Executing %d extraction actions (set, regex_extract, extract)",
+                len(non_derive_actions),
+            )
         for action in non_derive_actions:
             result = action.act(text, all_variables)
             if result is not None:
@@ -87,19 +267,23 @@ class Rule:
 
         # Phase 2: Execute derive actions to compute derived variables
         # Derived variables are computed AFTER all source variables are extracted
-        logger.debug(
-            f"Phase 2: Executing {len(derive_actions)} derivation actions "
-            f"(derive - computed from extracted variables)"
-        )
+        if debug:
+            logger.debug(
+                "Phase 2: Executing %d derivation actions "
+                "(derive - computed from extracted variables)",
+                len(derive_actions),
+            )
         for action in derive_actions:
             result = action.act(text, all_variables)
             if result is not None:
                 all_variables[action.variable] = result
 
-        var_count = len(all_variables)
-        logger.info(
-            f"✓ Rule {self.rule_id} matched successfully with {var_count} variable(s) extracted"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✓ Rule %s matched successfully with %d variable(s) extracted",
+                self.rule_id,
+                len(all_variables),
+            )
 
         # Return all extracted variables without scope separation
         # Processor will handle scope separation based on variable lists
@@ -5,6 +5,11 @@ Validates rule files to ensure they conform to the expected schema and structure
 Supports both global rules (rule_name) and form rules (form_name).
 """
 
+import io
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, redirect_stdout
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +21,49 @@ from .parser import RuleParser
 
 logger = setup_logger()
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _iter_rule_files(rules_dir: str) -> Iterator[str]:
+    """
+    Yield the YAML files under rules_dir, in sorted path order.
+
+    Walks the tree once with os.scandir, whose entries carry the file type so
+    no extra stat call is needed per file. Only one directory's entries are
+    held at a time. rules_dir itself is listed before this returns, so a
+    missing directory raises here rather than partway through validation.
+    """
+    return _iter_entries(_sorted_entries(rules_dir))
+
+
+def _sorted_entries(directory: str) -> list[os.DirEntry]:
+    """List a directory's entries, sorted by name."""
+    with os.scandir(directory) as it:
+        return sorted(it, key=lambda entry: entry.name)
+
+
+def _iter_entries(entries: list[os.DirEntry]) -> Iterator[str]:
+    """Yield the YAML files among entries and, recursively, their subdirectories."""
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_entries(_sorted_entries(entry.path))
+        elif entry.name.endswith((".yaml", ".yml")) and entry.is_file():
+            yield entry.path
+
+
+def _validate_one(rule_path: str) -> tuple[bool, list[str], list[str], str]:
+    """
+    Validate a single rule file in a worker process.
+
+    Returns:
+        Tuple of (valid, errors, warnings, printed output)
+    """
+    validator = RuleValidator()
+    with redirect_stdout(io.StringIO()) as output:
+        valid = validator.validate_rule_file(rule_path)
+    return valid, validator.errors, validator.warnings, output.getvalue()
+
 
 class RuleValidator:
     """Validates rule files against schema and consistency requirements."""
@@ -29,19 +77,21 @@ class RuleValidator:
     def validate_rule_file(self, rule_path: str) -> bool:
         """Validate a single rule file."""
         path = Path(rule_path)
-        if not path.exists():
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
             self.errors.append(f"Rule file not found: {rule_path}")
             return False
 
         print(f"\nValidating: {path.name}")
 
-        # Validate YAML syntax
-        try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            self.errors.append(f"{path.name}: Invalid YAML syntax: {e}")
-            return False
+        # Validate YAML syntax; the loaded data is reused for all checks below
+        with f:
+            try:
+                data = yaml.load(f, Loader=_YAML_LOADER)
+            except yaml.YAMLError as e:
+                self.errors.append(f"{path.name}: Invalid YAML syntax: {e}")
+                return False
 
         # Validate required identifier
         rule_id = data.get("rule_id")
@@ -63,15 +113,13 @@ class RuleValidator:
             self.errors.append(f"{path.name}: Failed to parse rule: {e}")
             return False
 
-        # Validate variable usage in actions (if variables are declared)
-        if "variables" in data:
-            self._validate_variable_usage(path.name, data)
-
         # Validate criteria structure
         self._validate_criteria(path.name, data.get("criteria", []))
 
-        # Validate actions structure
-        self._validate_actions(path.name, data.get("actions", []))
+        # Validate actions structure and variable usage (if variables are declared)
+        self._validate_actions_and_usage(
+            path.name, data.get("actions", []), self._declared_variables(data)
+        )
 
         # Enforce FORM_NAME for form rules
         if "forms" in str(path.parent):
@@ -93,30 +141,15 @@ class RuleValidator:
 
         return True
 
-    def _validate_variable_usage(self, rule_name: str, data: dict[str, Any]) -> None:
-        """Validate that variables used in actions are declared."""
+    @staticmethod
+    def _declared_variables(data: dict[str, Any]) -> set[str]:
+        """Collect the global, local and derived variables a rule declares."""
+        variables = data.get("variables") or {}
         declared_vars = set()
-        if "variables" in data:
-            declared_vars.update(data["variables"].get("global", []))
-            declared_vars.update(data["variables"].get("local", []))
-            declared_vars.update(data["variables"].get("derived", []))
-
-        for action in data.get("actions", []):
-            if "variable" in action:
-                var_name = action["variable"]
-                if declared_vars and var_name not in declared_vars:
-                    self.warnings.append(
-                        f"{rule_name}: Action uses undeclared variable: {var_name}"
-                    )
-
-            # Check derive action source variable
-            if action.get("type") == "derive" and "from" in action:
-                source_var = action["from"]
-                if declared_vars and source_var not in declared_vars:
-                    self.warnings.append(
-                        f"{rule_name}: Derive action references undeclared "
-                        f"source variable: {source_var}"
-                    )
+        declared_vars.update(variables.get("global", []))
+        declared_vars.update(variables.get("local", []))
+        declared_vars.update(variables.get("derived", []))
+        return declared_vars
 
     def _validate_criteria(self, rule_name: str, criteria: list[Any]) -> None:
         """Validate criteria structure."""
@@ -132,46 +165,96 @@ class RuleValidator:
             if "criteria" in criterion:
                 self._validate_criteria(f"{rule_name} (nested)", criterion["criteria"])
 
-    def _validate_actions(self, rule_name: str, actions: list[Any]) -> None:
-        """Validate actions structure."""
+    def _validate_actions_and_usage(
+        self, rule_name: str, actions: list[Any], declared_vars: set[str]
+    ) -> None:
+        """
+        Validate actions structure and that the variables they use are declared.
+
+        Both checks are made in one pass over the actions. Usage is only checked
+        when the rule declares variables.
+        """
         for i, action in enumerate(actions, 1):
             if not isinstance(action, dict):
                 self.errors.append(f"{rule_name}: Action {i} is not a dictionary")
                 continue
 
+            action_type = action.get("type")
             if "type" not in action:
                 self.errors.append(f"{rule_name}: Action {i} missing 'type' field")
 
-            if "variable" not in action and action.get("type") != "extract":
+            if "variable" in action:
+                var_name = action["variable"]
+                if declared_vars and var_name not in declared_vars:
+                    self.warnings.append(
+                        f"{rule_name}: Action uses undeclared variable: {var_name}"
+                    )
+            elif action_type != "extract":
                 self.warnings.append(f"{rule_name}: Action {i} missing 'variable' field")
 
-    def validate_directory(self, rules_dir: str) -> bool:
+            # Check derive action source variable
+            if action_type == "derive" and "from" in action:
+                source_var = action["from"]
+                if declared_vars and source_var not in declared_vars:
+                    self.warnings.append(
+                        f"{rule_name}: Derive action references undeclared "
+                        f"source variable: {source_var}"
+                    )
+
+    def validate_directory(self, rules_dir: str, jobs: int = 1) -> bool:
         """
         Validate all rule files in a directory.
         Supports both flat structure and global/forms subdirectories.
+
+        Files are independent, so with more than one job they are validated in
+        worker processes (YAML and rule parsing are CPU-bound and hold the GIL).
+        Output, errors and warnings are still reported in file order.
+
+        Args:
+            rules_dir: Directory to search for rule files
+            jobs: Number of worker processes (default: 1, validates inline)
         """
-        rules_path = Path(rules_dir)
-        if not rules_path.exists():
+        if jobs < 1:
+            raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+        try:
+            rule_files = _iter_rule_files(rules_dir)
+        except FileNotFoundError:
             self.errors.append(f"Rules directory not found: {rules_dir}")
             return False
+        except NotADirectoryError:
+            rule_files = iter(())
 
-        # Find all YAML files (including in subdirectories)
-        yaml_files = list(rules_path.rglob("*.yaml")) + list(rules_path.rglob("*.yml"))
-
-        if not yaml_files:
+        # Validate YAML files (including in subdirectories) as they are found
+        all_valid = True
+        found = 0
+        with ExitStack() as stack:
+            if jobs > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+                results = map(self._merge_result, executor.map(_validate_one, rule_files))
+            else:
+                results = map(self.validate_rule_file, rule_files)
+
+            for valid in results:
+                found += 1
+                all_valid = all_valid and valid
+
+        if not found:
             self.errors.append(f"No rule files found in {rules_dir}")
             return False
 
-        print(f"Found {len(yaml_files)} rule file(s) to validate")
-
-        # Validate each file
-        all_valid = True
-        for rule_file in sorted(yaml_files):
-            if not self.validate_rule_file(str(rule_file)):
-                all_valid = False
+        print(f"\nValidated {found} rule file(s)")
 
         return all_valid
 
+    def _merge_result(self, result: tuple[bool, list[str], list[str], str]) -> bool:
+        """Fold a worker's result (see _validate_one) into this validator."""
+        valid, errors, warnings, output = result
+        print(output, end="")
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
+        return valid
+
     def print_summary(self) -> None:
         """Print validation summary."""
         print("\n" + "=" * 60)
@@ -19,145 +19,155 @@ Usage:
     uv run python scripts/generate_name_dictionaries.py
 """
 
+import argparse
 import csv
+import io
+import itertools
 import subprocess
 import sys
-import tempfile
+import zipfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+CENSUS_URL = "https://www2.census.gov/topics/genealogy/2010surnames/names.zip"
+SSA_URL = "https://www.ssa.gov/oact/babynames/names.zip"
 
-def download_file(url: str, output_path: Path) -> bool:
-    """Download a file using wget or curl."""
+
+def download_file(url: str) -> bytes | None:
+    """
+    Download a file into memory using wget or curl.
+
+    The archives are a few MB each, so they are read straight from the tool's stdout
+    instead of being written to a temporary file and read back.
+    """
     print(f"📥 Downloading {url}...")
 
     # Try wget first
     try:
-        subprocess.run(
-            ["wget", "-q", "-O", str(output_path), url],
+        return subprocess.run(
+            ["wget", "-q", "-O", "-", url],
             check=True,
-            capture_output=True,
-        )
-        return True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ).stdout
     except (subprocess.CalledProcessError, FileNotFoundError):
         pass
 
     # Fallback to curl
     try:
-        subprocess.run(
-            ["curl", "-sL", "-o", str(output_path), url],
+        return subprocess.run(
+            ["curl", "-sL", url],
             check=True,
-            capture_output=True,
-        )
-        return True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ).stdout
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("❌ Error: Neither wget nor curl found. Please install one of them.")
-        return False
+        return None
 
 
-def extract_zip(zip_path: Path, extract_to: Path, files: list[str] | None = None) -> bool:
-    """Extract specific files from a zip archive."""
-    try:
-        import zipfile
-
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            if files:
-                for file in files:
-                    try:
-                        zip_ref.extract(file, extract_to)
-                    except KeyError:
-                        print(f"⚠️  Warning: {file} not found in archive")
-            else:
-                zip_ref.extractall(extract_to)
-        return True
-    except Exception as e:
-        print(f"❌ Error extracting {zip_path}: {e}")
-        return False
+def _project_root() -> Path:
+    """
+    Find the project root (the nearest directory with a pyproject.toml).
 
+    When installed as a package, __file__ is in src/nominal/scripts/, so search up to
+    5 levels; fall back to going up 3 levels.
+    """
+    script_dir = Path(__file__).parent
+    return next(
+        (p for p in (script_dir, *script_dir.parents[:4]) if (p / "pyproject.toml").exists()),
+        script_dir.parent.parent.parent,
+    )
 
-def generate_last_names(temp_dir: Path, output_file: Path) -> bool:
-    """Generate last names dictionary from US Census data."""
-    print("\n📊 Processing US Census surnames...")
 
-    census_url = "https://www2.census.gov/topics/genealogy/2010surnames/names.zip"
-    zip_path = temp_dir / "census.zip"
+def _open_zip(archive_data: bytes) -> zipfile.ZipFile | None:
+    """Open a downloaded archive in memory, reporting (rather than raising) a bad download."""
+    try:
+        return zipfile.ZipFile(io.BytesIO(archive_data))
+    except zipfile.BadZipFile as e:
+        print(f"❌ Error opening downloaded archive: {e}")
+        return None
 
-    if not download_file(census_url, zip_path):
-        return False
 
-    if not extract_zip(zip_path, temp_dir, ["Names_2010Census.csv"]):
-        return False
+def _write_names(output_file: Path, names: Iterable[bytes]) -> None:
+    """Write one encoded name per line, streaming into a large buffer rather than joining first."""
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        f.writelines(name + b"\n" for name in names)
 
-    csv_path = temp_dir / "Names_2010Census.csv"
-    if not csv_path.exists():
-        print(f"❌ Error: Expected file {csv_path} not found after extraction")
+
+def generate_last_names(archive_data: bytes, output_file: Path) -> bool:
+    """Generate last names dictionary from the downloaded US Census archive."""
+    print("\n📊 Processing US Census surnames...")
+
+    archive = _open_zip(archive_data)
+    if archive is None:
         return False
 
-    # Extract top 50,000 surnames
+    # Extract top 50,000 surnames, decompressing the CSV as it is read
     surnames = []
     try:
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                surnames.append(row["name"].strip().upper())
-                if len(surnames) >= 50000:
-                    break
+        with archive, archive.open("Names_2010Census.csv") as raw:
+            # Plain rows rather than DictReader: only one column is needed
+            reader = csv.reader(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+            name_index = next(reader).index("name")
+            for row in itertools.islice(reader, 50000):
+                surnames.append(row[name_index].strip().upper().encode("utf-8"))
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(surnames))
-            f.write("\n")
+        _write_names(output_file, surnames)
 
         print(f"✅ Generated {len(surnames):,} surnames → {output_file}")
         return True
 
+    except KeyError:
+        print("❌ Error: Names_2010Census.csv not found in census archive")
+        return False
     except Exception as e:
         print(f"❌ Error processing census data: {e}")
         return False
 
 
-def generate_first_names(temp_dir: Path, output_file: Path) -> bool:
-    """Generate first names dictionary from SSA data."""
+def generate_first_names(archive_data: bytes, output_file: Path) -> bool:
+    """Generate first names dictionary from the downloaded SSA archive."""
     print("\n📊 Processing SSA baby names...")
 
-    ssa_url = "https://www.ssa.gov/oact/babynames/names.zip"
-    zip_path = temp_dir / "ssa.zip"
-
-    if not download_file(ssa_url, zip_path):
-        return False
-
-    # Extract only recent years (2020-2023)
-    files_to_extract = [f"yob{year}.txt" for year in range(2020, 2024)]
-    if not extract_zip(zip_path, temp_dir, files_to_extract):
+    archive = _open_zip(archive_data)
+    if archive is None:
         return False
 
-    # Collect unique first names across all years
-    first_names = set()
+    # Collect unique first names across recent years (2020-2023). Names stay as raw
+    # UTF-8 bytes throughout: they hash and compare more cheaply than str, and bytewise
+    # order of UTF-8 is the same as code point order, so the sorted output is unchanged.
+    first_names: set[bytes] = set()
     years_processed = 0
 
-    for year in range(2020, 2024):
-        year_file = temp_dir / f"yob{year}.txt"
-        if not year_file.exists():
-            print(f"⚠️  Warning: {year_file} not found, skipping")
-            continue
-
-        try:
-            with open(year_file, encoding="utf-8") as f:
-                for line in f:
-                    name = line.split(",")[0].strip().upper()
-                    first_names.add(name)
-            years_processed += 1
-        except Exception as e:
-            print(f"⚠️  Warning: Error processing {year_file}: {e}")
+    with archive:
+        for year in range(2020, 2024):
+            member = f"yob{year}.txt"
+            try:
+                # Each member is small (<1 MB): read it whole, uppercase it in one pass
+                # and split it in one go. Rows are "name,sex,count", so only the first
+                # field is kept.
+                lines = archive.read(member).upper().split(b"\n")
+            except KeyError:
+                print(f"⚠️  Warning: {member} not found in archive, skipping")
+                continue
+
+            try:
+                first_names |= {line.split(b",", 1)[0].strip() for line in lines if line}
+                years_processed += 1
+            except Exception as e:
+                print(f"⚠️  Warning: Error processing {member}: {e}")
 
     if years_processed == 0:
         print("❌ Error: No SSA data files could be processed")
         return False
 
-    # Write sorted first names
+    # Write sorted first names. One C-level sort of the deduplicated union beats
+    # heapq.merge/groupby over per-year sorted lists, which runs its loop in Python.
     try:
         sorted_names = sorted(first_names)
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(sorted_names))
-            f.write("\n")
+        _write_names(output_file, sorted_names)
 
         print(f"✅ Generated {len(sorted_names):,} first names → {output_file}")
         return True
@@ -167,8 +177,18 @@ def generate_first_names(temp_dir: Path, output_file: Path) -> bool:
         return False
 
 
-def main():
+def main(args: list[str] | None = None):
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate name dictionaries from US Census and SSA data."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate dictionaries even if they already exist",
+    )
+    parsed_args = parser.parse_args(args)
+
     print("=" * 70)
     print("Name Dictionary Generator")
     print("=" * 70)
@@ -178,25 +198,8 @@ def main():
     print("  • US Social Security Administration (first names)")
     print()
 
-    # Determine project root and data directory
-    # When installed as a package, __file__ is in src/nominal/scripts/
-    # We need to go up to find the actual project root with data/
-    script_dir = Path(__file__).parent
-
-    # Try to find project root by looking for pyproject.toml
-    current = script_dir
-    project_root = None
-    for _ in range(5):  # Search up to 5 levels
-        if (current / "pyproject.toml").exists():
-            project_root = current
-            break
-        current = current.parent
-
-    # Fallback: assume we're in src/nominal/scripts, go up 3 levels
-    if project_root is None:
-        project_root = script_dir.parent.parent.parent
-
-    data_dir = project_root / "data"
+    # Determine data directory
+    data_dir = _project_root() / "data"
 
     # Create data directory if it doesn't exist
     data_dir.mkdir(exist_ok=True)
@@ -207,13 +210,35 @@ def main():
     print(f"Output directory: {data_dir}")
     print()
 
-    # Create temporary directory for downloads
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    # (source URL, generator, output file) per dictionary
+    jobs = [
+        (CENSUS_URL, generate_last_names, output_last),
+        (SSA_URL, generate_first_names, output_first),
+    ]
+
+    # Existing dictionaries are kept (and not downloaded again) unless --force is given
+    results = {}
+    pending = []
+    for job in jobs:
+        output = job[2]
+        if output.exists() and not parsed_args.force:
+            print(f"⏭️  {output} already exists, skipping (use --force to regenerate)")
+            results[output] = True
+        else:
+            pending.append(job)
+
+    if pending:
+        # The downloads are independent and network-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            downloads = [executor.submit(download_file, url) for url, _, _ in pending]
 
         # Generate dictionaries
-        success_last = generate_last_names(temp_path, output_last)
-        success_first = generate_first_names(temp_path, output_first)
+        for (_, generate, output), download in zip(pending, downloads):
+            archive_data = download.result()
+            results[output] = archive_data is not None and generate(archive_data, output)
+
+    success_last = results[output_last]
+    success_first = results[output_first]
 
     # Summary
     print()
@@ -221,7 +246,7 @@ def main():
     if success_last and success_first:
         print("✅ SUCCESS: Name dictionaries generated successfully!")
         print()
-        print("📁 Files created:")
+        print("📁 Files:")
         print(f"   • {output_first} ({output_first.stat().st_size:,} bytes)")
         print(f"   • {output_last} ({output_last.stat().st_size:,} bytes)")
         print()
@@ -20,12 +20,20 @@ Usage:
 """
 
 import argparse
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from nominal.orchestrator import NominalOrchestrator
 
+# Any non-digit, including the non-ASCII spaces and hyphens PDF extraction produces
+_NON_DIGITS_RE = re.compile(r"\D")
+
+# A compacted 9-digit TIN, split into its XXX-XX-XXXX groups
+_TIN_RE = re.compile(r"(\d{3})(\d{2})(\d{4})")
+
 # ============================================================================
 # Derived Variable Functions
 # ============================================================================
@@ -34,6 +42,12 @@ from nominal.orchestrator import NominalOrchestrator
 # ============================================================================
 
 
+@lru_cache(maxsize=256)
+def _name_parts(full_name: str) -> tuple[str, ...]:
+    """Split a FULL_NAME once; LAST_NAME, FIRST_NAME and NAME_TIN_COMBO all reuse it."""
+    return tuple(full_name.split())
+
+
 def derive_last_name(all_vars: dict[str, Any]) -> str:
     """
     Extract last name from FULL_NAME variable.
@@ -42,7 +56,7 @@ def derive_last_name(all_vars: dict[str, Any]) -> str:
     """
     full_name = all_vars.get("FULL_NAME", "")
     if full_name:
-        parts = full_name.strip().split()
+        parts = _name_parts(full_name)
         return parts[-1] if parts else "UNKNOWN"
     return "UNKNOWN"
 
@@ -55,7 +69,7 @@ def derive_first_name(all_vars: dict[str, Any]) -> str:
     """
     full_name = all_vars.get("FULL_NAME", "")
     if full_name:
-        parts = full_name.strip().split()
+        parts = _name_parts(full_name)
         return parts[0] if parts else "UNKNOWN"
     return "UNKNOWN"
 
@@ -71,12 +85,10 @@ def derive_full_tin(all_vars: dict[str, Any]) -> str:
     tin = all_vars.get("SSN") or all_vars.get("EIN") or all_vars.get("TIN", "")
 
     if tin:
-        # Remove any existing dashes or spaces
-        tin_digits = "".join(c for c in tin if c.isdigit())
-
-        # Format as SSN if 9 digits
-        if len(tin_digits) == 9:
-            return f"{tin_digits[:3]}-{tin_digits[3:5]}-{tin_digits[5:]}"
+        # Remove any existing dashes or spaces, then format as SSN if 9 digits
+        match = _TIN_RE.fullmatch(_NON_DIGITS_RE.sub("", tin))
+        if match:
+            return "-".join(match.groups())
 
     return "UNKNOWN"
 
@@ -2,23 +2,49 @@
 End-to-end tests for the Nominal Orchestrator.
 """
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
 
 import pytest
 from nominal.orchestrator import NominalOrchestrator
+from nominal.processor import NominalProcessor
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link a fixture into place, copying only when it lives on another filesystem."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
 class TestOrchestrator:
     """End-to-end tests for NominalOrchestrator."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def rules_dir(self):
         """Get the rules directory path."""
         project_root = Path(__file__).parent.parent.parent.parent
         return str(project_root / "rules")
 
+    @pytest.fixture(scope="session")
+    def loaded_processor(self, rules_dir):
+        """Parse the rule files once for the whole session."""
+        return NominalProcessor(rules_dir)
+
+    @pytest.fixture
+    def make_orchestrator(self, loaded_processor):
+        """Build fresh orchestrators that share the session's parsed (immutable) rules."""
+
+        def make(**kwargs):
+            orchestrator = NominalOrchestrator(None, **kwargs)
+            orchestrator.processor.load_rules_from(loaded_processor)
+            return orchestrator
+
+        return make
+
     @pytest.fixture
     def fixtures_dir(self):
         """Get the fixtures directory path."""
@@ -31,7 +57,8 @@ class TestOrchestrator:
             with tempfile.TemporaryDirectory() as output_dir:
                 yield Path(input_dir), Path(output_dir)
 
-    def test_orchestrator_e2e(self, rules_dir, fixtures_dir, temp_dirs):
+    @pytest.mark.ocr
+    def test_orchestrator_e2e(self, make_orchestrator, fixtures_dir, temp_dirs):
         """Test the full workflow from reading to renaming."""
         input_dir, output_dir = temp_dirs
 
@@ -42,11 +69,11 @@ class TestOrchestrator:
         if not w2_src.exists() or not misc_src.exists():
             pytest.fail("PDF fixtures not found")
 
-        shutil.copy2(w2_src, input_dir / "w2.pdf")
-        shutil.copy2(misc_src, input_dir / "1099.pdf")
+        _link_or_copy(w2_src, input_dir / "w2.pdf")
+        _link_or_copy(misc_src, input_dir / "1099.pdf")
 
         # Initialize orchestrator
-        orchestrator = NominalOrchestrator(rules_dir)
+        orchestrator = make_orchestrator()
 
         # Process directory
         pattern = "{rule_id}_{FULL_NAME}_{TIN_LAST_FOUR}"
@@ -69,10 +96,10 @@ class TestOrchestrator:
         assert any("W2" in f for f in filenames)
         assert any("1099" in f for f in filenames)
 
-    def test_orchestrator_pattern_validation(self, rules_dir, temp_dirs):
+    def test_orchestrator_pattern_validation(self, make_orchestrator, temp_dirs):
         """Test that orchestrator validates filename pattern."""
         input_dir, output_dir = temp_dirs
-        orchestrator = NominalOrchestrator(rules_dir)
+        orchestrator = make_orchestrator()
 
         # Pattern with non-existent variable
         invalid_pattern = "{rule_id}_{NON_EXISTENT_VAR}"
@@ -82,12 +109,12 @@ class TestOrchestrator:
                 str(input_dir), str(output_dir), filename_pattern=invalid_pattern
             )
 
-    def test_orchestrator_derived_variables(self, rules_dir, fixtures_dir, temp_dirs):
+    def test_orchestrator_derived_variables(self, make_orchestrator, fixtures_dir, temp_dirs):
         """Test orchestrator-level derived variables."""
         input_dir, output_dir = temp_dirs
 
         # Copy fixture
-        shutil.copy2(fixtures_dir / "Sample-W2.pdf", input_dir / "w2.pdf")
+        _link_or_copy(fixtures_dir / "Sample-W2.pdf", input_dir / "w2.pdf")
 
         # Define orchestrator-level derived variable
         def derive_last_name(vars):
@@ -98,9 +125,7 @@ class TestOrchestrator:
                 return parts[-1] if parts else "UNKNOWN"
             return "UNKNOWN"
 
-        orchestrator = NominalOrchestrator(
-            rules_dir, derived_variables={"DERIVED_LAST_NAME": derive_last_name}
-        )
+        orchestrator = make_orchestrator(derived_variables={"DERIVED_LAST_NAME": derive_last_name})
 
         # Pattern uses the derived variable
         pattern = "{rule_id}_{DERIVED_LAST_NAME}"
@@ -117,7 +142,7 @@ class TestOrchestrator:
         # So DERIVED_LAST_NAME should be "DARLING"
         assert "W2_DARLING.pdf" == output_files[0].name
 
-    def test_orchestrator_unmatched(self, rules_dir, temp_dirs):
+    def test_orchestrator_unmatched(self, make_orchestrator, temp_dirs):
         """Test handling of unmatched files."""
         input_dir, output_dir = temp_dirs
 
@@ -128,7 +153,7 @@ class TestOrchestrator:
             f.write("This is not a PDF content, but has the extension.")
 
         # Initialize orchestrator
-        orchestrator = NominalOrchestrator(rules_dir)
+        orchestrator = make_orchestrator()
 
         # Process directory
         stats = orchestrator.process_directory(str(input_dir), str(output_dir))
@@ -6,7 +6,7 @@ import os
 import tempfile
 
 from nominal.processor import NominalProcessor
-from nominal.rules import RuleParser
+from nominal.rules import RegexCriterion, Rule, RuleParser
 
 
 class TestNominalProcessor:
@@ -88,6 +88,137 @@ class TestNominalProcessor:
         assert result["local_variables"]["FORM_NAME"] == "W2"
         assert result["global_variables"]["TIN_LAST_FOUR"] == "6789"
 
+    def test_process_document_stream(self):
+        """Test that a document given as pages matches the same as the joined text."""
+        processor = NominalProcessor()
+        parser = RuleParser()
+        processor.global_rules.append(
+            parser.parse_dict(
+                {
+                    "rule_id": "ssn-extractor",
+                    "criteria": [{"type": "regex", "pattern": "."}],
+                    "actions": [
+                        {
+                            "type": "regex_extract",
+                            "variable": "TIN_LAST_FOUR",
+                            "from_text": True,
+                            "pattern": r"\b\d{3}-\d{2}-(\d{4})\b",
+                            "group": 1,
+                        },
+                    ],
+                }
+            )
+        )
+        processor.form_rules.append(
+            parser.parse_dict(
+                {
+                    "rule_id": "W2",
+                    "criteria": [
+                        {"type": "contains", "value": "form w-2", "case_sensitive": False}
+                    ],
+                    "actions": [{"type": "set", "variable": "FORM_NAME", "value": "W2"}],
+                }
+            )
+        )
+
+        pages = [f"Page {i} of 10" for i in range(1, 11)]
+        pages[3] += "\nForm W-2 Wage and Tax Statement"
+        pages[8] += "\nEmployee SSN: 123-45-6789"
+
+        expected = processor.process_document("\n".join(pages), document_id="w2")
+        result = processor.process_document(iter(pages), document_id="w2")
+
+        assert expected is not None
+        assert expected["global_variables"]["TIN_LAST_FOUR"] == "6789"
+        assert result == expected
+
+    def test_rules_missing_a_literal_are_not_applied(self, monkeypatch):
+        """Test that rules whose required literals are absent are skipped."""
+        processor = NominalProcessor()
+        parser = RuleParser()
+
+        rule_ids = [f"FORM-{i:02d}" for i in range(50)]
+        for rule_id in rule_ids:
+            processor.form_rules.append(
+                parser.parse_dict(
+                    {
+                        "rule_id": rule_id,
+                        "criteria": [{"type": "contains", "value": f"code {rule_id}"}],
+                        "actions": [{"type": "set", "variable": "FORM_NAME", "value": rule_id}],
+                    }
+                )
+            )
+
+        applied = []
+        apply = Rule.apply
+
+        def tracking_apply(rule, text, folded_text=None, *, prescanned=False):
+            applied.append((rule.rule_id, prescanned))
+            return apply(rule, text, folded_text=folded_text, prescanned=prescanned)
+
+        monkeypatch.setattr(Rule, "apply", tracking_apply)
+
+        result = processor.process_document("Tax form code FORM-37")
+
+        assert result is not None
+        assert result["rule_id"] == "FORM-37"
+        # The rule that is applied does not search for its literals a second time
+        assert applied == [("FORM-37", True)]
+
+    def test_documents_shorter_than_a_rule_allows_are_not_searched(self, monkeypatch):
+        """Test that a rule needing a longer match rejects short documents without searching."""
+        matched = []
+        match = RegexCriterion.match
+
+        def tracking_match(criterion, text, folded_text=None):
+            matched.append(criterion.pattern)
+            return match(criterion, text, folded_text)
+
+        monkeypatch.setattr(RegexCriterion, "match", tracking_match)
+        processor = NominalProcessor()
+        rule = RuleParser().parse_dict(
+            {
+                "rule_id": "SSN",
+                "criteria": [{"type": "regex", "pattern": r"Employee SSN: \d{3}-\d{2}-\d{4}"}],
+                "actions": [],
+            }
+        )
+        processor.form_rules.append(rule)
+        assert rule.min_text_length == len("Employee SSN: ")
+
+        assert processor.process_document("12345") is None
+        assert rule.apply("12345") is None
+        assert matched == []
+
+        assert rule.apply("Employee SSN: 123-45-6789") is not None
+        assert matched == [r"Employee SSN: \d{3}-\d{2}-\d{4}"]
+
+    def test_reloading_rules_dir_reuses_parsed_rules(self):
+        """Test that a second processor on the same rules directory reuses the parsed rules."""
+        rules_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..", "rules")
+
+        first = NominalProcessor(rules_dir)
+        second = NominalProcessor(rules_dir)
+
+        rules = first.global_rules + first.form_rules
+        assert rules
+        assert all(
+            a is b for a, b in zip(rules, second.global_rules + second.form_rules, strict=True)
+        )
+
+    def test_load_rules_from_shares_rules_not_batch_state(self):
+        """Test that a processor can reuse another's parsed rules with its own batch state."""
+        rules_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..", "rules")
+        loaded = NominalProcessor(rules_dir)
+        loaded.global_variables["SSN"] = "123-45-6789"
+
+        processor = NominalProcessor()
+        processor.load_rules_from(loaded)
+
+        assert processor.rules == loaded.rules
+        assert processor.form_rules is not loaded.form_rules
+        assert processor.global_variables == {}
+
     def test_process_document_no_match(self):
         """Test processing a document that doesn't match any form rule."""
         processor = NominalProcessor()
@@ -17,60 +17,88 @@ from nominal.processor import NominalProcessor
 from nominal.reader import NominalReader
 
 
+# Keep the class on one pytest-xdist worker so its session fixtures extract each PDF once
+@pytest.mark.xdist_group("processor_integration")
 class TestProcessorIntegration:
     """Integration tests using real rule files and sample documents."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def rules_dir(self):
         """Get the rules directory path."""
         # Rules directory is at project root (4 levels up from test file)
         project_root = Path(__file__).parent.parent.parent.parent
         return str(project_root / "rules")
 
-    @pytest.fixture
-    def processor(self, rules_dir):
-        """Create a processor with loaded rules."""
+    @pytest.fixture(scope="session")
+    def loaded_processor(self, rules_dir):
+        """Load the rule files once for the whole session."""
         if not os.path.exists(rules_dir):
             pytest.fail(f"Rules directory not found: {rules_dir}")
 
-        processor = NominalProcessor(rules_dir)
-        return processor
+        return NominalProcessor(rules_dir)
 
     @pytest.fixture
-    def reader(self):
-        """Create a reader instance."""
+    def processor(self, loaded_processor):
+        """Create a processor with loaded rules (and its own batch state)."""
+        processor = NominalProcessor()
+        processor.load_rules_from(loaded_processor)
+        return processor
+
+    @pytest.fixture(scope="session")
+    def reader_fast(self):
+        """Create a reader for PDFs with a text layer (no OCR)."""
+        return NominalReader(ocr_fallback=False)
+
+    @pytest.fixture(scope="session")
+    def reader_ocr(self):
+        """Create a reader that falls back to OCR for image-based PDFs."""
         return NominalReader(ocr_fallback=True)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def fixtures_dir(self):
         """Get the fixtures directory path."""
         # Fixtures directory is at test/fixtures (3 levels up from test file)
         return Path(__file__).parent.parent.parent / "fixtures"
 
-    @pytest.fixture
-    def w2_pdf_text(self, reader, fixtures_dir):
-        """Extract text from the W2 PDF fixture using reader."""
+    @pytest.fixture(scope="session")
+    def w2_pdf(self, fixtures_dir):
+        """Get the W2 PDF fixture path (checked once per session)."""
         w2_pdf = fixtures_dir / "Sample-W2.pdf"
         if not w2_pdf.exists():
             pytest.fail(f"W2 PDF fixture not found: {w2_pdf}")
+        return w2_pdf
 
+    @pytest.fixture(scope="session")
+    def w1099_pdf(self, fixtures_dir):
+        """Get the 1099 PDF fixture path (checked once per session)."""
+        w1099_pdf = fixtures_dir / "Sample-1099-image.pdf"
+        if not w1099_pdf.exists():
+            pytest.fail(f"1099 PDF fixture not found: {w1099_pdf}")
+        return w1099_pdf
+
+    @pytest.fixture(scope="session")
+    def w2_pdf_text(self, reader_fast, w2_pdf):
+        """Extract text from the W2 PDF fixture using reader."""
         # Isolate reader functionality - extract text from PDF
-        text = reader.read_pdf(str(w2_pdf))
+        text = reader_fast.read_pdf(str(w2_pdf))
         assert len(text) > 0, "Reader should extract text from W2 PDF"
         return text
 
-    @pytest.fixture
-    def w1099_pdf_text(self, reader, fixtures_dir):
+    @pytest.fixture(scope="session")
+    def w1099_pdf_text(self, reader_ocr, w1099_pdf):
         """Extract text from the 1099 PDF fixture using reader."""
-        w1099_pdf = fixtures_dir / "Sample-1099-image.pdf"
-        if not w1099_pdf.exists():
-            pytest.fail(f"1099 PDF fixture not found: {w1099_pdf}")
-
         # Isolate reader functionality - extract text from PDF
-        text = reader.read_pdf(str(w1099_pdf))
+        text = reader_ocr.read_pdf(str(w1099_pdf))
         assert len(text) > 0, "Reader should extract text from 1099 PDF"
         return text
 
+    @pytest.fixture(scope="session")
+    def w2_result(self, loaded_processor, w2_pdf_text):
+        """Process the W2 text once for tests that only read the result."""
+        processor = NominalProcessor()
+        processor.load_rules_from(loaded_processor)
+        return processor.process_document(w2_pdf_text)
+
     def test_w2_form_recognition(self, processor):
         """Test that W2 forms are correctly recognized and processed."""
         w2_text = """
@@ -116,9 +144,9 @@ class TestProcessorIntegration:
         # Check that it was logged as unmatched
         assert len(processor.unmatched_documents) >= 1
 
-    def test_process_real_w2_pdf(self, processor, w2_pdf_text):
+    def test_process_real_w2_pdf(self, w2_result):
         """Test processing a real W2 PDF file."""
-        result = processor.process_document(w2_pdf_text)
+        result = w2_result
 
         # Verify classification
         assert result is not None, "Real W2 PDF should be recognized"
@@ -137,6 +165,7 @@ class TestProcessorIntegration:
             assert tin_last_four is not None
             assert len(tin_last_four) == 4
 
+    @pytest.mark.ocr
     def test_process_real_1099_pdf(self, processor, w1099_pdf_text):
         """Test processing a real 1099 PDF file."""
         result = processor.process_document(w1099_pdf_text)
@@ -152,6 +181,7 @@ class TestProcessorIntegration:
         # Verify global variables structure
         assert isinstance(result["global_variables"], dict)
 
+    @pytest.mark.ocr
     def test_process_batch_with_real_pdfs(self, processor, w2_pdf_text, w1099_pdf_text):
         """Test batch processing with real PDF content."""
         documents = [
@@ -173,6 +203,7 @@ class TestProcessorIntegration:
         assert results[1]["rule_id"] in ["1099-DIV", "1099-MISC"]
         assert results[1]["document_id"] == "1099_sample"
 
+    @pytest.mark.ocr
     def test_process_batch_global_variable_consistency(
         self, processor, w2_pdf_text, w1099_pdf_text
     ):
@@ -236,13 +267,8 @@ class TestProcessorIntegration:
         result = processor.process_document("Any text")
         assert result is None
 
-    def test_multiple_rules_first_match_wins(self, rules_dir):
+    def test_multiple_rules_first_match_wins(self, processor):
         """Test that when multiple rules could match, the first one wins."""
-        if not os.path.exists(rules_dir):
-            pytest.fail(f"Rules directory not found: {rules_dir}")
-
-        processor = NominalProcessor(rules_dir)
-
         # Create text that matches W2 form
         text = """
         W-2 Wage and Tax Statement
@@ -256,14 +282,10 @@ class TestProcessorIntegration:
         assert result is not None
         assert "rule_id" in result
 
-    def test_reader_isolation(self, reader, processor, fixtures_dir):
+    def test_reader_isolation(self, reader_fast, processor, w2_pdf):
         """Test that reader functionality is isolated."""
-        w2_pdf = fixtures_dir / "Sample-W2.pdf"
-        if not w2_pdf.exists():
-            pytest.fail(f"W2 PDF fixture not found: {w2_pdf}")
-
         # Step 1: Use reader to extract text (isolated reader functionality)
-        extracted_text = reader.read_pdf(str(w2_pdf))
+        extracted_text = reader_fast.read_pdf(str(w2_pdf))
         assert len(extracted_text) > 0, "Reader should extract text from PDF"
 
         # Step 2: Use processor to classify document (isolated processor functionality)
@@ -293,9 +315,9 @@ class TestProcessorIntegration:
         assert len(unmatched) == 1
         assert unmatched[0]["document_id"] == "non_matching"
 
-    def test_global_rules_applied_before_classification(self, processor, w2_pdf_text):
+    def test_global_rules_applied_before_classification(self, w2_result):
         """Test that global rules extract variables before form classification."""
-        result = processor.process_document(w2_pdf_text)
+        result = w2_result
 
         assert result is not None
         # Global variables should be extracted
@@ -1,24 +1,28 @@
+import os
+import tempfile
+import time
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from nominal.reader import NominalReader
+from nominal.reader.reader import _prune_ocr_cache
 
 
-class TestNominalReader(unittest.TestCase):
-    @patch("fitz.open")
-    @patch("os.path.exists")
-    def test_read_pdf_text_extraction(self, mock_exists, mock_fitz_open):
-        # Setup
-        mock_exists.return_value = True
+class _StubDocument(list):
+    """A document stub: iterable pages with a no-op close()."""
 
-        # Mock PDF document and page
-        mock_doc = MagicMock()
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "Sample PDF content."
+    def close(self):
+        pass
 
-        # Make the doc iterable yielding the page
-        mock_doc.__iter__.return_value = [mock_page]
-        mock_fitz_open.return_value = mock_doc
+
+class TestNominalReader(unittest.TestCase):
+    @patch("fitz.open")
+    def test_read_pdf_text_extraction(self, mock_fitz_open):
+        # Plain stubs: nothing is asserted on the page or document calls
+        page = SimpleNamespace(get_text=lambda *args, **kwargs: "Sample PDF content.")
+        mock_fitz_open.return_value = _StubDocument([page])
 
         reader = NominalReader(ocr_fallback=False)
         content = reader.read_pdf("dummy.pdf")
@@ -26,14 +30,46 @@ class TestNominalReader(unittest.TestCase):
         self.assertIn("Sample PDF content.", content)
         mock_fitz_open.assert_called_with("dummy.pdf")
 
-    @patch("pytesseract.image_to_string")
-    @patch("PIL.Image.open")
     @patch("fitz.open")
-    @patch("os.path.exists")
-    def test_read_pdf_ocr_fallback(self, mock_exists, mock_fitz_open, mock_image_open, mock_ocr):
-        # Setup
-        mock_exists.return_value = True
+    def test_read_pdf_max_pages(self, mock_fitz_open):
+        loaded = []
+
+        def load(i):
+            loaded.append(i)
+            return SimpleNamespace(get_text=lambda *args, **kwargs: f"Page {i}")
+
+        class LazyDocument(_StubDocument):
+            # Pages are loaded as they are iterated, as with PyMuPDF documents
+            def __iter__(self):
+                return map(load, range(len(self)))
+
+        mock_fitz_open.return_value = LazyDocument([None] * 5)
+
+        reader = NominalReader(ocr_fallback=False)
+        content = reader.read_pdf("dummy.pdf", max_pages=2)
+
+        self.assertEqual(content, "Page 0\nPage 1")
+        self.assertEqual(loaded, [0, 1])
+
+    @patch("fitz.open")
+    def test_iter_pdf_pages_closes_document_when_stopped_early(self, mock_fitz_open):
+        page = SimpleNamespace(get_text=lambda *args, **kwargs: "Page text")
+        mock_doc = MagicMock()
+        mock_doc.__iter__.return_value = [page, page, page]
+        mock_fitz_open.return_value = mock_doc
+
+        reader = NominalReader(ocr_fallback=False)
+        pages = reader.iter_pdf_pages("dummy.pdf")
+        self.assertEqual(next(pages), "Page text")
+        mock_doc.close.assert_not_called()
 
+        pages.close()
+        mock_doc.close.assert_called_once()
+
+    @patch("nominal.reader.reader._new_tesserocr_api", return_value=None)
+    @patch("pytesseract.image_to_string")
+    @patch("fitz.open")
+    def test_read_pdf_ocr_fallback(self, mock_fitz_open, mock_ocr, mock_tesserocr_api):
         # Mock PDF document and page with empty text
         mock_doc = MagicMock()
         mock_page = MagicMock()
@@ -41,21 +77,169 @@ class TestNominalReader(unittest.TestCase):
 
         # Mock pixmap for OCR
         mock_pix = MagicMock()
-        mock_pix.tobytes.return_value = b"fake_image_data"
+        mock_pix.samples = b"fake_image_data"
+        mock_pix.width, mock_pix.height = 5, 1
         mock_page.get_pixmap.return_value = mock_pix
 
         mock_doc.__iter__.return_value = [mock_page]
         mock_fitz_open.return_value = mock_doc
 
-        # Mock OCR result
-        mock_ocr.return_value = "OCR Content"
+        # Mock OCR result, checking it is given the page as a grayscale PGM file
+        def ocr(image_path):
+            with open(image_path, "rb") as f:
+                self.assertEqual(f.read(), b"P5\n5 1\n255\nfake_image_data")
+            return "OCR Content"
+
+        mock_ocr.side_effect = ocr
 
         reader = NominalReader(ocr_fallback=True)
+        self.addCleanup(reader.close)
         content = reader.read_pdf("scan.pdf")
 
         self.assertIn("OCR Content", content)
         mock_ocr.assert_called()
 
+    @patch("nominal.reader.reader._new_tesserocr_api", return_value=None)
+    @patch("pytesseract.image_to_string")
+    @patch("fitz.open")
+    def test_read_pdf_ocr_pages_keep_order(self, mock_fitz_open, mock_ocr, mock_tesserocr_api):
+        # Scanned pages OCR'd concurrently, with a text page in between
+        pages = []
+        for i in range(4):
+            page = MagicMock()
+            page.get_text.return_value = "   "
+            pix = page.get_pixmap.return_value
+            pix.samples = f"page {i}".encode()
+            pix.width, pix.height = len(pix.samples), 1
+            pages.append(page)
+        pages[2].get_text.return_value = "Plain text page " * 10
+        pages[2].get_images.return_value = []
+        pages[2].get_image_info.return_value = []
+
+        mock_doc = MagicMock()
+        mock_doc.__iter__.return_value = pages
+        mock_fitz_open.return_value = mock_doc
+
+        # Later pages finish OCR first
+        def ocr(image_path):
+            with open(image_path, "rb") as f:
+                image = f.read().rsplit(b"\n", 1)[1].decode()
+            time.sleep(0.05 * (4 - int(image[-1])))
+            return f"OCR Content of {image}"
+
+        mock_ocr.side_effect = ocr
+
+        reader = NominalReader(ocr_fallback=True)
+        self.addCleanup(reader.close)
+        content = reader.read_pdf("scan.pdf")
+
+        self.assertEqual(
+            content.split("\n"),
+            [
+                "OCR Content of page 0",
+                "OCR Content of page 1",
+                "Plain text page " * 10,
+                "OCR Content of page 3",
+            ],
+        )
+        self.assertEqual(mock_ocr.call_count, 3)
+
+    @patch("nominal.reader.reader._new_tesserocr_api", return_value=None)
+    @patch("pytesseract.image_to_string")
+    @patch("fitz.open")
+    def test_read_pdf_ocr_cache(self, mock_fitz_open, mock_ocr, mock_tesserocr_api):
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "   "
+        mock_pix = mock_page.get_pixmap.return_value
+        mock_pix.samples = b"fake_image_data"
+        mock_pix.width, mock_pix.height = 5, 1
+
+        mock_doc = MagicMock()
+        mock_doc.__iter__.return_value = [mock_page]
+        mock_fitz_open.return_value = mock_doc
+
+        mock_ocr.return_value = "OCR Content\r\n"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            reader = NominalReader(ocr_fallback=True, ocr_cache_dir=cache_dir)
+            self.addCleanup(reader.close)
+            self.assertEqual(reader.read_pdf("scan.pdf"), "OCR Content\r\n")
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # The same page image is not OCR'd again, even by another reader
+            reader = NominalReader(ocr_fallback=True, ocr_cache_dir=cache_dir)
+            self.addCleanup(reader.close)
+            self.assertEqual(reader.read_pdf("scan.pdf"), "OCR Content\r\n")
+            self.assertEqual(mock_ocr.call_count, 1)
+
+            # A different page image is
+            mock_pix.samples = b"other_image_data"
+            reader.read_pdf("scan.pdf")
+            self.assertEqual(mock_ocr.call_count, 2)
+
+    @patch("nominal.reader.reader._new_tesserocr_api", return_value=None)
+    @patch("pytesseract.image_to_string", return_value="OCR Content")
+    @patch("fitz.open")
+    def test_read_pdf_ocr_cache_failure_is_not_fatal(
+        self, mock_fitz_open, mock_ocr, mock_tesserocr_api
+    ):
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "   "
+        mock_pix = mock_page.get_pixmap.return_value
+        mock_pix.samples = b"fake_image_data"
+        mock_pix.width, mock_pix.height = 5, 1
+
+        mock_doc = MagicMock()
+        mock_doc.__iter__.return_value = [mock_page]
+        mock_fitz_open.return_value = mock_doc
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            reader = NominalReader(ocr_fallback=True, ocr_cache_dir=cache_dir)
+            self.addCleanup(reader.close)
+            with patch("os.replace", side_effect=OSError("No space left on device")):
+                self.assertEqual(reader.read_pdf("scan.pdf"), "OCR Content")
+
+            # The partial entry is cleaned up rather than left behind
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    @patch("nominal.reader.reader._new_tesserocr_api")
+    @patch("fitz.open")
+    def test_tesserocr_api_reused_across_pdfs(self, mock_fitz_open, mock_new_api):
+        api = mock_new_api.return_value
+        api.GetUTF8Text.return_value = "OCR Content"
+
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "   "
+        mock_pix = mock_page.get_pixmap.return_value
+        mock_pix.samples = b"fake_image_data"
+        mock_pix.width, mock_pix.height = 5, 1
+
+        mock_doc = MagicMock()
+        mock_doc.__iter__.return_value = [mock_page]
+        mock_fitz_open.return_value = mock_doc
+
+        reader = NominalReader(ocr_fallback=True)
+        self.assertEqual(reader.read_pdf("scan1.pdf"), "OCR Content")
+        self.assertEqual(reader.read_pdf("scan2.pdf"), "OCR Content")
+
+        # Tesseract's model is loaded once for both PDFs and released on close
+        mock_new_api.assert_called_once()
+        api.End.assert_not_called()
+        reader.close()
+        api.End.assert_called_once()
+
+    def test_ocr_cache_prunes_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for i in range(5):
+                path = os.path.join(cache_dir, f"{i}.txt")
+                with open(path, "w") as f:
+                    f.write(str(i))
+                os.utime(path, (i, i))
+
+            _prune_ocr_cache(Path(cache_dir), max_entries=3)
+
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["2.txt", "3.txt", "4.txt"])
+
     def test_file_not_found(self):
         reader = NominalReader()
         with self.assertRaises(FileNotFoundError):
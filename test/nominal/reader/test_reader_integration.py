@@ -1,6 +1,7 @@
 import os
 import unittest
 
+import pytest
 from nominal.reader import NominalReader
 
 
@@ -30,6 +31,7 @@ class TestNominalReaderIntegration(unittest.TestCase):
         self.assertTrue("elizabeth" in content)
         self.assertTrue("darling" in content)
 
+    @pytest.mark.ocr
     def test_read_image_pdf_with_ocr(self):
         """Test reading an image-based PDF using OCR."""
         # Ensure Tesseract is available in the environment for this test to pass
@@ -3,6 +3,9 @@ Unit tests for the Nominal Rules package.
 """
 
 
+import re
+import sys
+
 import pytest
 from nominal.rules import (
     ActionType,
@@ -15,6 +18,7 @@ from nominal.rules import (
     RegexCriterion,
     RegexExtractAction,
     RuleParser,
+    RuleValidator,
     SetAction,
 )
 
@@ -59,10 +63,51 @@ class TestRuleParser:
 
         assert criterion.get_type() == CriterionType.REGEX
         assert isinstance(criterion, RegexCriterion)
+        assert isinstance(criterion._compiled, re.Pattern)
         assert criterion.pattern == r"\d{3}-\d{2}-\d{4}"
         assert criterion.capture is True
         assert criterion.variable == "SSN"
 
+    @pytest.mark.parametrize(
+        ("criterion_data", "expected_type"),
+        [
+            ({"type": "regex", "pattern": "Form W-2"}, ContainsCriterion),
+            ({"type": "regex", "pattern": "Form W-?2"}, RegexCriterion),
+            ({"type": "regex", "pattern": "W-2", "capture": True, "variable": "F"}, RegexCriterion),
+        ],
+    )
+    def test_parse_literal_regex_as_contains(self, criterion_data, expected_type):
+        """Test that non-capturing regexes without metacharacters become contains checks."""
+        criterion = RuleParser()._parse_criterion(criterion_data)
+
+        assert type(criterion) is expected_type
+        assert criterion.match("Form W-2 Wage and Tax Statement")[0] is True
+        assert criterion.match("form w-2")[0] is False
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            (r"Form W-?2", len("Form W")),
+            (r"SSN: \d{3}", len("SSN: ")),
+            (r"Box (\d+)", len("Box ")),
+            (r"Form 1099|W-2", 0),
+            (r"^Form", 0),
+        ],
+    )
+    def test_regex_min_text_length(self, pattern, expected):
+        """Test that a regex's length bound counts only its leading literal characters."""
+        assert RegexCriterion(pattern).min_text_length() == expected
+
+    def test_criteria_take_description_positionally(self):
+        """Test that description can still be passed after the other fields."""
+        contains = ContainsCriterion("W-2", False, "Form name")
+        regex = RegexCriterion(r"\d+", True, "BOX", "Box number")
+
+        assert contains.description == "Form name"
+        assert regex.description == "Box number"
+        assert AllCriterion([contains, regex], "Both").description == "Both"
+        assert AnyCriterion([contains, regex], "Either").description == "Either"
+
     def test_parse_composite_criterion(self):
         """Test parsing composite (all/any) criteria."""
         criterion_data = {
@@ -80,6 +125,36 @@ class TestRuleParser:
         assert isinstance(criterion, AllCriterion)
         assert len(criterion.sub_criteria) == 2
 
+    def test_parse_nested_composite_criterion(self):
+        """Test parsing composite criteria nested several levels deep."""
+        criterion_data = {
+            "type": "any",
+            "criteria": [
+                {
+                    "type": "all",
+                    "criteria": [
+                        {"type": "contains", "value": "W-2"},
+                        {"type": "any", "criteria": [{"type": "regex", "pattern": "wages?"}]},
+                    ],
+                },
+                {"type": "contains", "value": "W2"},
+            ],
+        }
+
+        criterion = RuleParser()._parse_criterion(criterion_data)
+
+        assert isinstance(criterion, AnyCriterion)
+        all_criterion, contains = criterion.sub_criteria
+        assert isinstance(contains, ContainsCriterion) and contains.value == "W2"
+        assert isinstance(all_criterion, AllCriterion)
+        assert [type(c) for c in all_criterion.sub_criteria] == [ContainsCriterion, AnyCriterion]
+        assert all_criterion.sub_criteria[1].sub_criteria[0].pattern == "wages?"
+
+    def test_parse_unknown_criterion_type_raises_error(self):
+        """Test that an unknown nested criterion type raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown criterion type: nope"):
+            RuleParser()._parse_criterion({"type": "all", "criteria": [{"type": "nope"}]})
+
     def test_parse_derive_action(self):
         """Test parsing a derive action."""
         action_data = {
@@ -100,6 +175,84 @@ class TestRuleParser:
         assert action.method == "slice"
         assert action.args["start"] == -4
 
+    def test_parse_action_interns_variable_names(self):
+        """Test that parsed variable names are interned."""
+        # Build the names at runtime; string literals would be interned already
+        variable = "".join(["TIN_", "LAST_FOUR"])
+        from_var = "".join(["S", "SN"])
+
+        action = RuleParser()._parse_action(
+            {"type": "derive", "variable": variable, "from": from_var, "method": "upper"}
+        )
+
+        assert variable is not sys.intern("TIN_LAST_FOUR")
+        assert action.variable is sys.intern("TIN_LAST_FOUR")
+        assert action.from_var is sys.intern("SSN")
+
+    def test_parse_unknown_action_type_raises_error(self):
+        """Test that an unknown action type raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown action type: nope"):
+            RuleParser()._parse_action({"type": "nope", "variable": "X"})
+
+    def test_parse_file_is_cached_until_file_changes(self, tmp_path):
+        """Test that parse_file reuses parsed rules until the file is modified."""
+        rule_file = tmp_path / "rule.yaml"
+        rule_file.write_text(
+            "rule_id: TEST\n"
+            "criteria:\n  - type: contains\n    value: test\n"
+            "actions:\n  - type: set\n    variable: FORM_NAME\n    value: TEST\n"
+        )
+
+        parser = RuleParser()
+        rule = parser.parse_file(str(rule_file))
+        assert parser.parse_file(str(rule_file)) is rule
+
+        rule_file.write_text(rule_file.read_text().replace("TEST", "CHANGED"))
+        changed = parser.parse_file(str(rule_file))
+        assert changed is not rule
+        assert changed.rule_id == "CHANGED"
+
+    def test_identical_rule_files_parsed_once(self, tmp_path):
+        """Test that rule files with identical contents share one parsed Rule."""
+        content = (
+            "rule_id: SHARED\n"
+            "criteria:\n  - type: contains\n    value: test\n"
+            "actions:\n  - type: set\n    variable: FORM_NAME\n    value: SHARED\n"
+        )
+        (tmp_path / "a.yaml").write_text(content)
+        (tmp_path / "b.yaml").write_text(content)
+
+        parser = RuleParser()
+        rule = parser.parse_file(str(tmp_path / "a.yaml"))
+        assert parser.parse_file(str(tmp_path / "b.yaml")) is rule
+
+    def test_parse_file_uses_json_cache(self, tmp_path, monkeypatch):
+        """Test that rule files are cached as JSON when a cache directory is set."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("NOMINAL_RULES_CACHE_DIR", str(cache_dir))
+        rule_file = tmp_path / "rule.yaml"
+        rule_file.write_text(
+            "rule_id: CACHED\n"
+            "criteria:\n  - type: contains\n    value: test\n"
+            "actions:\n  - type: set\n    variable: FORM_NAME\n    value: CACHED\n"
+        )
+
+        parser = RuleParser()
+        parser.clear_cache()
+        rule = parser.parse_file(str(rule_file))
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        # Identical rule files still share one parsed Rule
+        copy_file = tmp_path / "copy.yaml"
+        copy_file.write_bytes(rule_file.read_bytes())
+        assert parser.parse_file(str(copy_file)) is rule
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        # A second load reads the JSON copy and never touches the YAML parser
+        parser.clear_cache()
+        monkeypatch.setattr("yaml.load", None)
+        assert parser.parse_file(str(rule_file)) == rule
+
     def test_missing_required_field_raises_error(self):
         """Test that missing required fields raise ValueError."""
         parser = RuleParser()
@@ -138,6 +291,7 @@ class TestCriterion:
     def test_regex_criterion(self):
         """Test regex evaluation."""
         criterion = RegexCriterion(pattern=r"\d{3}-\d{2}-\d{4}")
+        assert isinstance(criterion._compiled, re.Pattern)
 
         matches, captured = criterion.match("SSN: 123-45-6789")
         assert matches is True
@@ -149,12 +303,21 @@ class TestCriterion:
     def test_regex_with_capture(self):
         """Test regex evaluation with capture."""
         criterion = RegexCriterion(pattern=r"\d{3}-\d{2}-\d{4}", capture=True, variable="SSN")
+        assert isinstance(criterion._compiled, re.Pattern)
 
         matches, captured = criterion.match("SSN: 123-45-6789")
 
         assert matches is True
         assert captured["SSN"] == "123-45-6789"
 
+    def test_regex_criterion_invalid_pattern(self):
+        """Test that an invalid pattern is accepted but never matches."""
+        criterion = RegexCriterion(pattern=r"(\d{3}")
+
+        matches, captured = criterion.match("SSN: 123-45-6789")
+        assert matches is False
+        assert captured == {}
+
     def test_all_criterion(self):
         """Test 'all' composite criterion."""
         sub_criteria = [
@@ -188,6 +351,73 @@ class TestCriterion:
         matches, _ = criterion.match("neither")
         assert matches is False
 
+    def test_composite_criterion_orders_cheapest_first(self):
+        """Test that composite criteria evaluate contains checks before regexes."""
+        regex = RegexCriterion(pattern=r"\d{3}-\d{2}-\d{4}")
+        contains = ContainsCriterion(value="ssn", case_sensitive=False)
+
+        criterion = AllCriterion(sub_criteria=[regex, contains])
+        assert criterion._match_fns == (contains.match, regex.match)
+        # The declared order is what the criterion still reports
+        assert criterion.sub_criteria == [regex, contains]
+
+        # Capturing sub-criteria are evaluated in their declared order
+        capturing = RegexCriterion(pattern=r"\d{4}", capture=True, variable="LAST_FOUR")
+        criterion = AnyCriterion(sub_criteria=[capturing, contains])
+        assert criterion._match_fns == (capturing.match, contains.match)
+
+    def test_composite_criterion_shares_folded_text(self):
+        """Test that case-insensitive sub-criteria search the lowered text passed in."""
+        criterion = AnyCriterion(
+            sub_criteria=[
+                ContainsCriterion(value="Employee", case_sensitive=False),
+                ContainsCriterion(value="Employer", case_sensitive=False),
+            ]
+        )
+        assert criterion.folds_case() is True
+
+        matches, _ = criterion.match("EMPLOYER COPY")
+        assert matches is True
+
+        matches, _ = criterion.match("EMPLOYER COPY", folded_text="employer copy")
+        assert matches is True
+
+        # The given lowered text is used as is rather than recomputed
+        matches, _ = criterion.match("EMPLOYER COPY", folded_text="recipient copy")
+        assert matches is False
+
+    def test_composite_criterion_short_circuits(self, monkeypatch):
+        """Test that composites stop at the first deciding cheap sub-criterion."""
+        regex_calls = []
+        match = RegexCriterion.match
+
+        def tracking_match(criterion, text):
+            regex_calls.append(criterion.pattern)
+            return match(criterion, text)
+
+        monkeypatch.setattr(RegexCriterion, "match", tracking_match)
+        regex = RegexCriterion(pattern=r"\d{3}-\d{2}-\d{4}")
+        contains = ContainsCriterion(value="ssn", case_sensitive=False)
+
+        matches, _ = AllCriterion(sub_criteria=[regex, contains]).match("no number here")
+        assert matches is False
+
+        matches, _ = AnyCriterion(sub_criteria=[regex, contains]).match("SSN below")
+        assert matches is True
+
+        assert regex_calls == []
+
+    def test_composite_criterion_binds_sub_criteria_matches(self):
+        """Test that composites bind their sub-criteria's match methods in evaluation order."""
+        regex = RegexCriterion(pattern=r"\d{3}-\d{2}-\d{4}")
+        contains = ContainsCriterion(value="ssn", case_sensitive=False)
+
+        for criterion in (
+            AllCriterion(sub_criteria=[regex, contains]),
+            AnyCriterion(sub_criteria=[regex, contains]),
+        ):
+            assert criterion._match_fns == (contains.match, regex.match)
+
 
 class TestAction:
     """Tests for Action subclasses."""
@@ -207,6 +437,7 @@ class TestAction:
         action = RegexExtractAction(
             variable="FIRST_NAME", pattern=r"Name:\s+(\w+)\s+(\w+)", group=1, from_text=True
         )
+        assert isinstance(action._compiled, re.Pattern)
 
         result = action.act(text, {})
 
@@ -219,6 +450,7 @@ class TestAction:
         action = DeriveAction(
             variable="SSN_LAST_FOUR", from_var="SSN", method="slice", args={"start": -4}
         )
+        assert action._fn_args == slice(-4, None)
 
         result = action.act("", variables)
 
@@ -234,6 +466,16 @@ class TestAction:
 
         assert result == "JOHN DOE"
 
+    def test_derive_action_resolves_method_at_construction(self):
+        """Test that derive actions resolve their method once, and unknown ones derive nothing."""
+        action = DeriveAction(variable="NAME_LOWER", from_var="NAME", method="lower", args={})
+        assert action._fn is not None
+        assert action.act("", {"NAME": "John Doe"}) == "john doe"
+
+        action = DeriveAction(variable="NAME_TITLE", from_var="NAME", method="title", args={})
+        assert action._fn is None
+        assert action.act("", {"NAME": "john doe"}) is None
+
     def test_extract_split_action(self):
         """Test extract action with split method."""
         variables = {"FULL_NAME": "John Doe"}
@@ -244,7 +486,187 @@ class TestAction:
             method="split",
             args={"pattern": r"\s+", "index": 0},
         )
+        assert isinstance(action._split_pattern, re.Pattern)
+        assert action._split_index == 0
 
         result = action.act("", variables)
 
         assert result == "John"
+
+    @pytest.mark.parametrize("method", ["split", "upper", "slice"])
+    def test_parse_action_with_null_args(self, method):
+        """Test that actions written with `args: null` parse as if args were omitted."""
+        parser = RuleParser()
+        for action_type in ("extract", "derive"):
+            action = parser._parse_action(
+                {
+                    "type": action_type,
+                    "variable": "OUT",
+                    "from": "FULL_NAME",
+                    "method": method,
+                    "args": None,
+                }
+            )
+            assert action.args == {}
+
+
+class TestRule:
+    """Tests for Rule evaluation."""
+
+    def test_literal_criteria_checked_before_other_criteria(self):
+        """Test that a missing literal rejects the rule without evaluating regexes."""
+        rule = RuleParser().parse_dict(
+            {
+                "rule_id": "W2",
+                "criteria": [
+                    {"type": "regex", "pattern": r"\d{3}-\d{2}-\d{4}"},
+                    {"type": "contains", "value": "form w-2", "case_sensitive": False},
+                ],
+                "actions": [{"type": "set", "variable": "FORM_NAME", "value": "W2"}],
+            }
+        )
+
+        assert rule._folded_literals == ("form w-2",)
+        assert len(rule._criteria) == 1
+
+        assert rule.apply("SSN: 123-45-6789") is None
+        result = rule.apply("FORM W-2 SSN: 123-45-6789")
+        assert result is not None
+        assert result["variables"]["FORM_NAME"] == "W2"
+
+    def test_nested_all_criteria_flattened_into_literals(self):
+        """Test that literals inside a top-level ALL join the literal pre-scan."""
+        rule = RuleParser().parse_dict(
+            {
+                "rule_id": "W2",
+                "criteria": [
+                    {"type": "contains", "value": "W-2"},
+                    {
+                        "type": "all",
+                        "criteria": [
+                            {"type": "contains", "value": "W-2"},
+                            {"type": "contains", "value": "wage", "case_sensitive": False},
+                            {"type": "regex", "pattern": r"\d{3}-\d{2}-\d{4}"},
+                        ],
+                    },
+                ],
+                "actions": [{"type": "set", "variable": "FORM_NAME", "value": "W2"}],
+            }
+        )
+
+        assert rule._literals == ("W-2",)
+        assert rule._folded_literals == ("wage",)
+        assert [type(c) for c in rule._criteria] == [RegexCriterion]
+
+        assert rule.apply("W-2 123-45-6789") is None
+        assert rule.apply("W-2 Wages 123-45-6789") is not None
+
+    def test_literals_checked_longest_first(self):
+        """Test that required literals are deduplicated and ordered longest first."""
+        rule = RuleParser().parse_dict(
+            {
+                "rule_id": "W2",
+                "criteria": [
+                    {"type": "contains", "value": "W-2"},
+                    {"type": "contains", "value": "Wage and Tax Statement"},
+                    {"type": "contains", "value": "W-2"},
+                    {"type": "contains", "value": "OMB"},
+                ],
+                "actions": [],
+            }
+        )
+
+        assert rule._literals == ("Wage and Tax Statement", "W-2", "OMB")
+
+    def test_rule_is_hashable(self):
+        """Test that rules can be used as dict keys."""
+        data = {
+            "rule_id": "W2",
+            "criteria": [{"type": "contains", "value": "W-2"}],
+            "actions": [{"type": "set", "variable": "FORM_NAME", "value": "W2"}],
+        }
+        rule = RuleParser().parse_dict(data)
+
+        results = {rule: "matched"}
+        assert results[RuleParser().parse_dict(data)] == "matched"
+
+    def test_criteria_ordered_cheapest_first(self):
+        """Test that regex criteria are evaluated before composite criteria."""
+        rule = RuleParser().parse_dict(
+            {
+                "rule_id": "W2",
+                "criteria": [
+                    {
+                        "type": "any",
+                        "criteria": [
+                            {"type": "contains", "value": "employee"},
+                            {"type": "contains", "value": "employer"},
+                        ],
+                    },
+                    {"type": "regex", "pattern": r"(?i)w-?2"},
+                ],
+                "actions": [{"type": "set", "variable": "FORM_NAME", "value": "W2"}],
+            }
+        )
+
+        assert [type(c) for c in rule._criteria] == [RegexCriterion, AnyCriterion]
+
+
+class TestRuleValidator:
+    """Tests for RuleValidator."""
+
+    def test_validate_directory_finds_nested_rule_files(self, tmp_path, capsys):
+        """Test that .yaml and .yml files are found recursively, in path order."""
+        rule = (
+            "rule_id: {rule_id}\n"
+            "variables: {{global: [], local: [], derived: []}}\n"
+            "criteria:\n  - type: contains\n    value: x\n"
+            "actions: []\n"
+        )
+        (tmp_path / "global").mkdir()
+        (tmp_path / "z.yml").write_text(rule.format(rule_id="Z"))
+        (tmp_path / "global" / "a.yaml").write_text(rule.format(rule_id="A"))
+        (tmp_path / "notes.txt").write_text("not a rule")
+
+        validator = RuleValidator()
+        assert validator.validate_directory(str(tmp_path))
+        assert not validator.errors
+
+        output = capsys.readouterr().out
+        assert "Validated 2 rule file(s)" in output
+        assert output.index("a.yaml") < output.index("z.yml")
+
+    def test_validate_directory_inline_matches_parallel(self, tmp_path):
+        """Test that validating inline and in worker processes report the same results."""
+        (tmp_path / "good.yaml").write_text(
+            "rule_id: GOOD\n"
+            "variables: {global: [SSN], local: [], derived: []}\n"
+            "criteria:\n  - type: contains\n    value: x\n"
+            "actions:\n  - type: set\n    variable: UNDECLARED\n    value: y\n"
+        )
+        (tmp_path / "bad.yaml").write_text("rule_id: BAD\ncriteria: []\n")
+
+        inline = RuleValidator()
+        parallel = RuleValidator()
+
+        assert not inline.validate_directory(str(tmp_path), jobs=1)
+        assert not parallel.validate_directory(str(tmp_path), jobs=2)
+        assert inline.errors == parallel.errors
+        assert inline.warnings == parallel.warnings
+        assert len(inline.errors) == 1
+        assert len(inline.warnings) == 1
+
+    def test_validate_directory_rejects_invalid_jobs(self, tmp_path):
+        """Test that a job count below one is rejected and a missing directory reported."""
+        validator = RuleValidator()
+        with pytest.raises(ValueError, match="jobs"):
+            validator.validate_directory(str(tmp_path), jobs=0)
+
+        assert not validator.validate_directory(str(tmp_path / "missing"))
+        assert validator.errors == [f"Rules directory not found: {tmp_path / 'missing'}"]
+
+    def test_validate_missing_file(self, tmp_path):
+        """Test that a missing rule file is reported as an error."""
+        validator = RuleValidator()
+        assert not validator.validate_rule_file(str(tmp_path / "missing.yaml"))
+        assert validator.errors == [f"Rule file not found: {tmp_path / 'missing.yaml'}"]
@@ -0,0 +1,24 @@
+"""
+Unit tests for the derived variable functions in nominal.scripts_derived.
+"""
+
+from nominal.scripts_derived import derive_full_tin
+
+
+class TestDeriveFullTin:
+    """Tests for derive_full_tin."""
+
+    def test_formats_nine_digit_tin(self):
+        """Test that a compacted or dashed TIN is formatted as XXX-XX-XXXX."""
+        assert derive_full_tin({"SSN": "123456789"}) == "123-45-6789"
+        assert derive_full_tin({"EIN": "12-3456789"}) == "123-45-6789"
+
+    def test_strips_unicode_separators(self):
+        """Test that TINs extracted with non-ASCII hyphens or spaces are still formatted."""
+        assert derive_full_tin({"SSN": "123\u201045\u20106789"}) == "123-45-6789"
+        assert derive_full_tin({"EIN": "12\u00a03456789"}) == "123-45-6789"
+
+    def test_unknown_without_nine_digits(self):
+        """Test that a missing or short TIN derives UNKNOWN."""
+        assert derive_full_tin({"TIN": "12-345"}) == "UNKNOWN"
+        assert derive_full_tin({}) == "UNKNOWN"
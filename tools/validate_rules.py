@@ -6,7 +6,7 @@ Validates rule files in the rules/ directory to ensure they conform
 to the expected schema and structure.
 
 Usage:
-    python tools/validate_rules.py [rules_directory]
+    python tools/validate_rules.py [rules_directory] [--jobs N]
 
 If no rules directory is specified, defaults to 'rules/' in the project root.
 
@@ -22,6 +22,18 @@ from pathlib import Path
 from nominal.rules import RuleValidator
 
 
+def _find_project_root(start: Path) -> Path:
+    """
+    Find the nearest directory at or above start with a pyproject.toml.
+
+    Falls back to the filesystem root.
+    """
+    return next(
+        (p for p in (start, *start.parents) if (p / "pyproject.toml").exists()),
+        Path(start.anchor),
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Nominal rule files",
@@ -32,6 +44,7 @@ Examples:
     %(prog)s rules/             # Validate all rules in rules directory
     %(prog)s rules/forms/       # Validate only form rules
     %(prog)s rules/global/      # Validate only global rules
+    %(prog)s -j 4               # Validate in 4 worker processes
 """,
     )
 
@@ -41,20 +54,23 @@ Examples:
         default=None,
         help="Directory containing rule files (default: rules/)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, validates inline)",
+    )
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Determine rules directory
     if args.rules_dir:
         rules_dir = Path(args.rules_dir)
     else:
-        # Find project root (look for pyproject.toml)
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / "pyproject.toml").exists():
-                break
-            current = current.parent
-        rules_dir = current / "rules"
+        rules_dir = _find_project_root(Path.cwd()) / "rules"
 
     if not rules_dir.exists():
         print(f"Error: Rules directory not found: {rules_dir}")
@@ -65,7 +81,7 @@ Examples:
 
     # Create validator and run validation
     validator = RuleValidator()
-    success = validator.validate_directory(str(rules_dir))
+    success = validator.validate_directory(str(rules_dir), jobs=args.jobs)
 
     # Print summary
     validator.print_summary()